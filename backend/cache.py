@@ -0,0 +1,65 @@
+import os
+import logging
+from typing import Optional
+from cachetools import TTLCache
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+# In-process cache for /buscar responses (rendered JSON bytes)
+# Entries expire after SEARCH_CACHE_TTL seconds, which also bounds how long
+# results stay stale after an ETL run (the ETL runs in a separate process).
+# Sized by the total bytes of cached bodies, not the number of entries.
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+
+search_cache = TTLCache(maxsize=SEARCH_CACHE_MAX_BYTES, ttl=SEARCH_CACHE_TTL, getsizeof=len)
+
+# Shared Redis cache for aggregate endpoints (rendered JSON bytes)
+# Unset REDIS_URL disables it; Redis errors are treated as cache misses.
+REDIS_URL = os.getenv("REDIS_URL")
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "300"))
+AUTOCOMPLETE_CACHE_TTL = int(os.getenv("AUTOCOMPLETE_CACHE_TTL", "600"))
+SUPPLIERS_CACHE_TTL = int(os.getenv("SUPPLIERS_CACHE_TTL", "120"))
+ARP_CACHE_TTL = int(os.getenv("ARP_CACHE_TTL", "3600"))
+
+# Deleted by the ETL at the end of each execution
+STATS_CACHE_KEY = "stats:v1"
+
+# Incremented by the ETL at the end of each execution; versioned keys
+# (arp:{id}:v{version}) and ETags are never invalidated, just orphaned
+ETL_VERSION_KEY = "etl:current_version"
+
+redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+
+async def redis_get(key: str) -> Optional[bytes]:
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning("redis get failed for %s: %s", key, e)
+        return None
+
+async def redis_set(key: str, ttl: int, value: bytes):
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, ttl, value)
+    except redis.RedisError as e:
+        logger.warning("redis set failed for %s: %s", key, e)
+
+async def etl_version() -> Optional[str]:
+    """Current ETL data version, or None when Redis is disabled/unavailable"""
+    if redis_client is None:
+        return None
+    try:
+        version = await redis_client.get(ETL_VERSION_KEY)
+    except redis.RedisError as e:
+        logger.warning("redis get failed for %s: %s", ETL_VERSION_KEY, e)
+        return None
+    return version.decode() if version else "0"
+
+async def close():
+    if redis_client is not None:
+        await redis_client.aclose()
@@ -0,0 +1,16 @@
+# Gunicorn settings (loaded automatically from the working directory)
+# Uvicorn workers pick uvloop + httptools when installed (uvicorn[standard]).
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Each worker has its own SQLAlchemy pool (DB_POOL_SIZE + DB_MAX_OVERFLOW);
+# behind PgBouncer they share its server-side pool.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2))
+
+# Long exports are streamed; don't kill workers mid-response
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
@@ -1,20 +1,20 @@
-from fastapi import FastAPI, Depends, Query, HTTPException
+from fastapi import FastAPI, Depends, Query, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse, ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, func, and_, or_, cast, String
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import date, datetime
-import models, database
-import pandas as pd
+import database, cache, queries
+import csv
 import io
-from collections import defaultdict
+import uuid
+import orjson
+from functools import lru_cache
 
-# Inicializar Banco
-models.Base.metadata.create_all(bind=database.engine)
-
-app = FastAPI(title="AtaHub API", version="2.0.0")
+app = FastAPI(title="AtaHub API", version="2.0.0", default_response_class=ORJSONResponse)
 
 # Configurar CORS
 app.add_middleware(
@@ -24,6 +24,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Comprimir respostas JSON (descrições longas e repetitivas comprimem bem)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Schema is managed by migrations/ (applied by the `migrate` service before startup)
+@app.on_event("shutdown")
+async def shutdown():
+    await database.engine.dispose()
+    await cache.close()
+
 # --- Pydantic Models ---
 
 class ItemResponse(BaseModel):
@@ -43,6 +52,8 @@ class SearchResult(BaseModel):
     vigencia_fim: Optional[date]
     vigencia_inicio: Optional[date]
     item: ItemResponse
+    cursor: Optional[str] = None  # pass as ?after= to fetch the next page (relevance/date sorts)
+    headline: Optional[str] = None  # descricao with <b>matches</b> highlighted (text search)
 
 class PriceStats(BaseModel):
     min_price: float
@@ -111,23 +122,91 @@ class ETLStatusResponse(BaseModel):
     items_processed: Optional[int]
     errors: Optional[int]
     duration_seconds: Optional[int]
-    started_at: Optional[str]
+    started_at: Optional[datetime]
 
 class ETLExecutionSummary(BaseModel):
     id: str
     execution_type: str
     status: str
-    started_at: str
-    completed_at: Optional[str]
+    started_at: datetime
+    completed_at: Optional[datetime]
     duration_seconds: Optional[int]
     arps_processed: int
     items_processed: int
     errors_count: int
 
+# --- Helpers ---
+
+# Full-text predicate on mv_search_items; matches idx_mv_search_items_search_vector (migration 006)
+# websearch_to_tsquery understands "exact phrase", or, -word
+TSQUERY_CLAUSE = "s.search_vector @@ websearch_to_tsquery('portuguese', :q)"
+TSQUERY_RANK = "ts_rank_cd(s.search_vector, websearch_to_tsquery('portuguese', :q))"
+# Highlighted match fragments; only evaluated for the rows of the returned page
+TSQUERY_HEADLINE = "ts_headline('portuguese', s.descricao, websearch_to_tsquery('portuguese', :q), 'MaxFragments=2')"
+
+# Rows returned by /comparar (cheapest first); stats cover all matches
+COMPARE_RESULTS_LIMIT = 200
+
+# Shortest term for ILIKE '%q%' lookups: below 3 chars there is no full
+# trigram, so the trgm indexes can't help and the whole table is scanned
+MIN_SUBSTRING_QUERY_LEN = 3
+
+@lru_cache(maxsize=512)
+def compiled_sql(sql: str):
+    """text() for a rendered dynamic query, reused across requests.
+
+    Dynamic SQL is built only from fixed fragments (values are always bound),
+    so there is one string per combination of active filters/sort.
+    """
+    return text(sql)
+
+async def tsquery_is_empty(db: AsyncSession, q: str) -> bool:
+    """True when q reduces to an empty tsquery (only stopwords/punctuation)"""
+    return (await db.execute(queries.TSQUERY_NUMNODE_SQL, {"q": q})).scalar() == 0
+
+async def stream_json_rows(sql, params: dict):
+    """Stream a query's JSON-text rows as a JSON array through a server-side cursor.
+
+    sql must select a single json_build_object(...)::text column, so rows are
+    written as-is with no per-row Python objects.
+
+    Opens its own session: the response body is produced after the endpoint
+    returns, when the request-scoped session may already be closed.
+    """
+    async with database.AsyncSessionLocal() as db:
+        result = await db.stream(sql.execution_options(max_row_buffer=100), params)
+        yield b"["
+        first = True
+        async for row in result.scalars():
+            if not first:
+                yield b","
+            yield row.encode()
+            first = False
+        yield b"]"
+
+async def stream_csv_rows(sql, params: dict, batch_size: int = 500):
+    """Stream a query's rows as CSV (header from the column names), one chunk per batch.
+
+    Memory stays bounded by batch_size regardless of the row count. Opens its
+    own session for the same reason as stream_json_rows.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    async with database.AsyncSessionLocal() as db:
+        result = await db.stream(sql.execution_options(yield_per=batch_size), params)
+        writer.writerow(result.keys())
+        async for batch in result.partitions():
+            writer.writerows(batch)
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate(0)
+        if buf.tell():  # header only (no rows)
+            yield buf.getvalue().encode()
+
 # --- Endpoints ---
 
 @app.get("/")
-def root():
+async def root():
     return {
         "status": "ok",
         "message": "AtaHub API v2.0 - Enhanced Government Procurement Platform",
@@ -138,13 +217,24 @@ def root():
             "stats": "/stats",
             "suppliers": "/fornecedores",
             "export": "/exportar",
-            "autocomplete": "/autocomplete"
+            "autocomplete": "/autocomplete",
+            "health": "/healthz"
         }
     }
 
+@app.get("/healthz")
+async def healthz():
+    """Readiness probe: one pooled connection, no ORM session"""
+    try:
+        async with database.engine.connect() as conn:
+            await conn.execute(queries.HEALTHCHECK_SQL)
+    except Exception:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"ok": True}
+
 @app.get("/buscar", response_model=List[SearchResult])
-def buscar_itens(
-    q: str = Query(default="", description="Search query"),
+async def buscar_itens(
+    q: str = Query(default="", min_length=2, description="Search query"),
     ufs: Optional[str] = Query(default=None, description="Comma-separated state codes"),
     min_price: Optional[float] = Query(default=None, ge=0),
     max_price: Optional[float] = Query(default=None, ge=0),
@@ -155,507 +245,404 @@ def buscar_itens(
     sort_by: str = Query(default="relevance", regex="^(relevance|price_asc|price_desc|date_asc|date_desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(database.get_db)
+    after: Optional[str] = Query(default=None, description="Keyset cursor (key|id) from the last result (relevance/date sorts)"),
+    db: AsyncSession = Depends(database.get_db)
 ):
     """Advanced search with multiple filters"""
 
+    # Normalize text filters once so the cache key and the SQL binds agree
+    orgao = orgao.strip() if orgao else None
+    fornecedor = fornecedor.strip() if fornecedor else None
+
+    # Normalized cache key: text filters are matched case-insensitively
+    cache_key = (
+        q.strip().lower(),
+        ufs.replace(" ", "").upper() if ufs else None,
+        min_price, max_price, vigencia_inicio, vigencia_fim,
+        orgao.lower() if orgao else None,
+        fornecedor.lower() if fornecedor else None,
+        sort_by, limit, offset, after
+    )
+    cached = cache.search_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     # Build WHERE clauses
-    where_clauses = ["arps.data_fim_vigencia >= CURRENT_DATE", "arps.ata_excluido = FALSE", "itens.item_excluido = FALSE"]
+    where_clauses = ["s.data_fim_vigencia >= CURRENT_DATE"]
     params = {}
 
     # Text search - only if query is provided
     if q and q.strip():
-        where_clauses.append("itens.search_vector @@ plainto_tsquery('portuguese', :q)")
+        # Stopword-only queries match nothing; skip the scan over mv_search_items
+        if await tsquery_is_empty(db, q):
+            cache.search_cache[cache_key] = b"[]"
+            return Response(content=b"[]", media_type="application/json")
+        where_clauses.append(TSQUERY_CLAUSE)
         params["q"] = q
 
     # State filter
     if ufs:
-        uf_list = [uf.strip().upper() for uf in ufs.split(",")]
-        uf_str = ",".join([f"'{uf}'" for uf in uf_list])
-        where_clauses.append(f"orgaos.uf IN ({uf_str})")
+        where_clauses.append("s.uf = ANY(:ufs)")
+        params["ufs"] = [uf.strip().upper() for uf in ufs.split(",")]
 
     # Price filter
     if min_price is not None:
-        where_clauses.append("itens.valor_unitario >= :min_price")
+        where_clauses.append("s.valor_unitario >= :min_price")
         params["min_price"] = min_price
 
     if max_price is not None:
-        where_clauses.append("itens.valor_unitario <= :max_price")
+        where_clauses.append("s.valor_unitario <= :max_price")
         params["max_price"] = max_price
 
     # Date filter
     if vigencia_inicio:
-        where_clauses.append("arps.data_inicio_vigencia >= :vigencia_inicio")
+        where_clauses.append("s.data_inicio_vigencia >= :vigencia_inicio")
         params["vigencia_inicio"] = vigencia_inicio
 
     if vigencia_fim:
-        where_clauses.append("arps.data_fim_vigencia <= :vigencia_fim")
+        where_clauses.append("s.data_fim_vigencia <= :vigencia_fim")
         params["vigencia_fim"] = vigencia_fim
 
     # Organization filter
     if orgao:
-        where_clauses.append("orgaos.nome ILIKE :orgao")
+        where_clauses.append("s.orgao_nome ILIKE :orgao")
         params["orgao"] = f"%{orgao}%"
 
     # Supplier filter
     if fornecedor:
-        where_clauses.append("itens.nome_fornecedor ILIKE :fornecedor")
+        where_clauses.append("s.nome_fornecedor ILIKE :fornecedor")
         params["fornecedor"] = f"%{fornecedor}%"
 
-    # Sort clause
+    # Sort clause (s.id breaks ties so pages are stable). Relevance and date
+    # sorts also emit a keyset cursor (key|id); price sorts page by offset only.
+    cursor_expr = "NULL"
+    keyset = None  # (key expression, SQL type, seek operator)
     if sort_by == "price_asc":
-        order_clause = "itens.valor_unitario ASC"
+        order_clause = "s.valor_unitario ASC, s.id"
     elif sort_by == "price_desc":
-        order_clause = "itens.valor_unitario DESC"
+        order_clause = "s.valor_unitario DESC, s.id"
     elif sort_by == "date_asc":
-        order_clause = "arps.data_fim_vigencia ASC"
-    elif sort_by == "date_desc":
-        order_clause = "arps.data_fim_vigencia DESC"
-    else:  # relevance (default for text search)
-        order_clause = "arps.data_fim_vigencia DESC"
+        order_clause = "s.data_fim_vigencia ASC, s.id ASC"
+        keyset = ("s.data_fim_vigencia", "date", ">")
+    elif sort_by == "date_desc" or "q" not in params:
+        order_clause = "s.data_fim_vigencia DESC, s.id DESC"
+        keyset = ("s.data_fim_vigencia", "date", "<")
+    else:  # relevance
+        order_clause = f"{TSQUERY_RANK} DESC, s.id DESC"
+        keyset = (TSQUERY_RANK, "real", "<")
+
+    if keyset:
+        key_expr, key_type, seek_op = keyset
+        cursor_expr = f"{key_expr}::text || '|' || s.id"
+        if after:
+            after_key, _, after_id = after.partition("|")
+            try:
+                params["after_key"] = float(after_key) if key_type == "real" else date.fromisoformat(after_key)
+                params["after_id"] = str(uuid.UUID(after_id))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            where_clauses.append(
+                f"({key_expr}, s.id) {seek_op} (CAST(:after_key AS {key_type}), CAST(:after_id AS uuid))"
+            )
+    elif after:
+        raise HTTPException(status_code=400, detail="Cursor pagination is not available for price sorts")
 
     where_sql = " AND ".join(where_clauses)
     params["limit"] = limit
     params["offset"] = offset
 
-    sql = text(f"""
-        SELECT
-            arps.id as id_arp, arps.numero_arp, arps.data_fim_vigencia, arps.data_inicio_vigencia,
-            orgaos.nome as orgao_nome, orgaos.uf,
-            itens.descricao, itens.valor_unitario, itens.marca, itens.quantidade,
-            itens.modelo, itens.unidade, itens.nome_fornecedor
-        FROM itens_arp itens
-        JOIN arps ON itens.arp_id = arps.id
-        JOIN orgaos ON arps.uasg_id = orgaos.uasg
-        WHERE {where_sql}
-        ORDER BY {order_clause}
+    # Each row is shaped as JSON by Postgres around the prebuilt item_json
+    # (migration 011); Python only joins them into an array
+    search_sql = """
+        SELECT json_build_object(
+            'id_arp', s.arp_id,
+            'numero_arp', s.numero_arp,
+            'orgao_nome', s.orgao_nome,
+            'uf', s.uf,
+            'vigencia_fim', s.data_fim_vigencia,
+            'vigencia_inicio', s.data_inicio_vigencia,
+            'cursor', {cursor},
+            'headline', {headline},
+            'item', s.item_json
+        )::text as row
+        FROM mv_search_items s
+        WHERE {where}
+        ORDER BY {order}
         LIMIT :limit OFFSET :offset
-    """)
+    """
+
+    headline_expr = TSQUERY_HEADLINE if "q" in params else "NULL"
+    sql = compiled_sql(search_sql.format(
+        where=where_sql, order=order_clause, cursor=cursor_expr, headline=headline_expr
+    ))
+    rows = (await db.execute(sql, params)).scalars().all()
+
+    # No full-text hit: retry with trigram word similarity (partial words,
+    # typos). <% compares the query to the best-matching part of descricao,
+    # so a short query still matches a long description; the requested sort
+    # is kept, relevance becomes closest match first.
+    if not rows and "q" in params and offset == 0 and not after:
+        fallback_where = " AND ".join(
+            ":q <% s.descricao" if clause == TSQUERY_CLAUSE else clause
+            for clause in where_clauses
+        )
+        if sort_by == "relevance":
+            fallback_order = "word_similarity(:q, s.descricao) DESC, s.id"
+        else:
+            fallback_order = order_clause
+        sql = compiled_sql(search_sql.format(
+            where=fallback_where,
+            order=fallback_order,
+            cursor="NULL",
+            headline="NULL"
+        ))
+        rows = (await db.execute(sql, params)).scalars().all()
+
+    body = ("[" + ",".join(rows) + "]").encode()
 
-    results = db.execute(sql, params).fetchall()
-
-    response = []
-    for row in results:
-        response.append({
-            "id_arp": str(row.id_arp),
-            "numero_arp": row.numero_arp,
-            "orgao_nome": row.orgao_nome,
-            "uf": row.uf,
-            "vigencia_fim": row.data_fim_vigencia,
-            "vigencia_inicio": row.data_inicio_vigencia,
-            "item": {
-                "descricao": row.descricao,
-                "valor_unitario": float(row.valor_unitario),
-                "marca": row.marca,
-                "quantidade": float(row.quantidade),
-                "modelo": row.modelo,
-                "unidade": row.unidade,
-                "fornecedor": row.nome_fornecedor
-            }
-        })
-    return response
+    cache.search_cache[cache_key] = body
+    return Response(content=body, media_type="application/json")
 
 @app.get("/comparar", response_model=PriceComparison)
-def comparar_precos(
-    q: str,
+async def comparar_precos(
+    q: str = Query(..., min_length=2),
     ufs: Optional[str] = None,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_db)
 ):
     """Compare prices for similar items across different ARPs"""
 
+    if await tsquery_is_empty(db, q):
+        raise HTTPException(status_code=404, detail="No items found for comparison")
+
     where_clauses = [
-        "itens.search_vector @@ plainto_tsquery('portuguese', :q)",
-        "arps.data_fim_vigencia >= CURRENT_DATE",
-        "arps.ata_excluido = FALSE",
-        "itens.item_excluido = FALSE"
+        TSQUERY_CLAUSE,
+        "s.data_fim_vigencia >= CURRENT_DATE"
     ]
     params = {"q": q}
 
     if ufs:
-        uf_list = [uf.strip().upper() for uf in ufs.split(",")]
-        uf_str = ",".join([f"'{uf}'" for uf in uf_list])
-        where_clauses.append(f"orgaos.uf IN ({uf_str})")
+        where_clauses.append("s.uf = ANY(:ufs)")
+        params["ufs"] = [uf.strip().upper() for uf in ufs.split(",")]
 
     where_sql = " AND ".join(where_clauses)
+    params["limit"] = COMPARE_RESULTS_LIMIT
 
-    # Get all matching items with prices
-    sql = text(f"""
+    # Stats, per-UF averages and the cheapest N rows are all computed by Postgres;
+    # the response body is built as JSON in the same round trip
+    sql = compiled_sql(f"""
+        WITH matched AS MATERIALIZED (
+            SELECT
+                s.arp_id, s.numero_arp, s.data_fim_vigencia, s.data_inicio_vigencia,
+                s.orgao_nome, s.uf,
+                s.descricao, s.valor_unitario, s.item_json
+            FROM mv_search_items s
+            WHERE {where_sql}
+        ),
+        priced AS (
+            SELECT valor_unitario::float8 as v, uf FROM matched WHERE valor_unitario > 0
+        ),
+        stats AS (
+            SELECT
+                COUNT(*) as count, MIN(v) as min_price, MAX(v) as max_price, AVG(v) as avg_price,
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY v) as median_price
+            FROM priced
+        ),
+        cheapest AS (
+            SELECT * FROM matched
+            ORDER BY valor_unitario ASC
+            LIMIT :limit
+        )
         SELECT
-            arps.id as id_arp, arps.numero_arp, arps.data_fim_vigencia, arps.data_inicio_vigencia,
-            orgaos.nome as orgao_nome, orgaos.uf,
-            itens.descricao, itens.valor_unitario, itens.marca, itens.quantidade,
-            itens.modelo, itens.unidade, itens.nome_fornecedor
-        FROM itens_arp itens
-        JOIN arps ON itens.arp_id = arps.id
-        JOIN orgaos ON arps.uasg_id = orgaos.uasg
-        WHERE {where_sql}
-        ORDER BY itens.valor_unitario ASC
+            (SELECT COUNT(*) FROM matched) as matched,
+            stats.count as priced,
+            json_build_object(
+                'item_description', (SELECT descricao FROM cheapest ORDER BY valor_unitario ASC LIMIT 1),
+                'stats', json_build_object(
+                    'min_price', stats.min_price,
+                    'max_price', stats.max_price,
+                    'avg_price', stats.avg_price,
+                    'median_price', stats.median_price,
+                    'count', stats.count,
+                    'savings_potential', stats.max_price - stats.min_price
+                ),
+                'results', (
+                    SELECT COALESCE(json_agg(json_build_object(
+                        'id_arp', c.arp_id,
+                        'numero_arp', c.numero_arp,
+                        'orgao_nome', c.orgao_nome,
+                        'uf', c.uf,
+                        'vigencia_fim', c.data_fim_vigencia,
+                        'vigencia_inicio', c.data_inicio_vigencia,
+                        'item', c.item_json
+                    ) ORDER BY c.valor_unitario ASC), '[]'::json)
+                    FROM cheapest c
+                ),
+                'by_state', (
+                    SELECT COALESCE(json_object_agg(uf, avg_price), '{{}}'::json)
+                    FROM (SELECT uf, AVG(v) as avg_price FROM priced WHERE uf <> '' GROUP BY uf) u
+                )
+            )::text as body
+        FROM stats
     """)
 
-    results = db.execute(sql, params).fetchall()
+    row = (await db.execute(sql, params)).mappings().one()
 
-    if not results:
+    if not row["matched"]:
         raise HTTPException(status_code=404, detail="No items found for comparison")
-
-    # Calculate statistics
-    prices = [float(row.valor_unitario) for row in results if row.valor_unitario]
-    if not prices:
+    if not row["priced"]:
         raise HTTPException(status_code=404, detail="No valid prices found")
 
-    prices.sort()
-    median_price = prices[len(prices) // 2] if prices else 0
-
-    stats = PriceStats(
-        min_price=min(prices),
-        max_price=max(prices),
-        avg_price=sum(prices) / len(prices),
-        median_price=median_price,
-        count=len(prices),
-        savings_potential=max(prices) - min(prices)
-    )
-
-    # Group by state
-    by_state = defaultdict(list)
-    for row in results:
-        if row.uf and row.valor_unitario:
-            by_state[row.uf].append(float(row.valor_unitario))
-
-    state_avg = {uf: sum(prices) / len(prices) for uf, prices in by_state.items()}
-
-    # Format results
-    search_results = []
-    for row in results:
-        search_results.append(SearchResult(
-            id_arp=str(row.id_arp),
-            numero_arp=row.numero_arp,
-            orgao_nome=row.orgao_nome,
-            uf=row.uf,
-            vigencia_fim=row.data_fim_vigencia,
-            vigencia_inicio=row.data_inicio_vigencia,
-            item=ItemResponse(
-                descricao=row.descricao,
-                valor_unitario=float(row.valor_unitario),
-                marca=row.marca,
-                quantidade=float(row.quantidade),
-                modelo=row.modelo,
-                unidade=row.unidade,
-                fornecedor=row.nome_fornecedor
-            )
-        ))
-
-    # Use the first item's description as representative
-    item_desc = results[0].descricao if results else q
-
-    return PriceComparison(
-        item_description=item_desc,
-        stats=stats,
-        results=search_results,
-        by_state=state_avg
-    )
+    return Response(content=row["body"].encode(), media_type="application/json")
 
 @app.get("/arp/{arp_id}", response_model=ArpDetail)
-def get_arp_detail(arp_id: str, db: Session = Depends(database.get_db)):
+async def get_arp_detail(arp_id: str, request: Request, db: AsyncSession = Depends(database.get_db)):
     """Get complete ARP details with all items"""
 
-    # Get ARP info
-    arp_sql = text("""
-        SELECT
-            arps.*,
-            orgaos.nome as orgao_nome, orgaos.uf
-        FROM arps
-        LEFT JOIN orgaos ON arps.uasg_id = orgaos.uasg
-        WHERE arps.id = :arp_id
-    """)
+    # ARP data only changes with ETL runs: cache and validate per data version
+    version = await cache.etl_version()
+    if version is not None:
+        etag = f'W/"{version}-{arp_id}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        cache_key = f"arp:{arp_id}:v{version}"
+        cached = await cache.redis_get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json", headers={"ETag": etag})
 
-    arp = db.execute(arp_sql, {"arp_id": arp_id}).fetchone()
+    body = (await db.execute(queries.ARP_DETAIL_SQL, {"arp_id": arp_id})).scalar()
 
-    if not arp:
+    if body is None:
         raise HTTPException(status_code=404, detail="ARP not found")
 
-    # Get all items
-    items_sql = text("""
-        SELECT
-            id, numero_item, descricao, valor_unitario, valor_total,
-            quantidade, unidade, marca, modelo,
-            nome_fornecedor, cnpj_fornecedor
-        FROM itens_arp
-        WHERE arp_id = :arp_id AND item_excluido = FALSE
-        ORDER BY numero_item
-    """)
+    body = body.encode()
+    if version is None:
+        return Response(content=body, media_type="application/json")
 
-    items = db.execute(items_sql, {"arp_id": arp_id}).fetchall()
-
-    return ArpDetail(
-        id=str(arp.id),
-        numero_arp=arp.numero_arp or "",
-        numero_compra=arp.numero_compra or "",
-        orgao_nome=arp.orgao_nome or "",
-        uf=arp.uf,
-        data_inicio_vigencia=arp.data_inicio_vigencia,
-        data_fim_vigencia=arp.data_fim_vigencia,
-        objeto=arp.objeto or "",
-        valor_total=float(arp.valor_total) if arp.valor_total else None,
-        quantidade_itens=len(items),
-        situacao=arp.situacao,
-        modalidade=arp.modalidade,
-        link_ata_pncp=arp.link_ata_pncp,
-        itens=[
-            ArpDetailItem(
-                id=str(item.id),
-                numero_item=item.numero_item or 0,
-                descricao=item.descricao or "",
-                valor_unitario=float(item.valor_unitario) if item.valor_unitario else 0.0,
-                valor_total=float(item.valor_total) if item.valor_total else None,
-                quantidade=float(item.quantidade) if item.quantidade else 0.0,
-                unidade=item.unidade,
-                marca=item.marca,
-                modelo=item.modelo,
-                fornecedor=item.nome_fornecedor,
-                cnpj_fornecedor=item.cnpj_fornecedor
-            ) for item in items
-        ]
-    )
+    await cache.redis_set(cache_key, cache.ARP_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @app.get("/stats", response_model=DashboardStats)
-def get_stats(db: Session = Depends(database.get_db)):
+async def get_stats(db: AsyncSession = Depends(database.get_db)):
     """Get dashboard statistics"""
 
-    # Total ARPs and value
-    arp_stats_sql = text("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE data_fim_vigencia >= CURRENT_DATE AND ata_excluido = FALSE) as active,
-            COALESCE(SUM(valor_total), 0) as total_value
-        FROM arps
-        WHERE ata_excluido = FALSE
-    """)
-
-    arp_stats = db.execute(arp_stats_sql).fetchone()
-
-    # Total items
-    items_stats_sql = text("""
-        SELECT COUNT(*) as total
-        FROM itens_arp
-        WHERE item_excluido = FALSE
-    """)
-
-    items_stats = db.execute(items_stats_sql).fetchone()
-
-    # ARPs by state
-    by_state_sql = text("""
-        SELECT orgaos.uf, COUNT(*) as count
-        FROM arps
-        JOIN orgaos ON arps.uasg_id = orgaos.uasg
-        WHERE arps.ata_excluido = FALSE
-        AND arps.data_fim_vigencia >= CURRENT_DATE
-        GROUP BY orgaos.uf
-        ORDER BY count DESC
-    """)
-
-    by_state = db.execute(by_state_sql).fetchall()
-    arps_by_state = {row.uf: row.count for row in by_state if row.uf}
-
-    # Recent ARPs
-    recent_sql = text("""
-        SELECT
-            arps.id, arps.numero_arp, arps.objeto,
-            orgaos.nome as orgao_nome, orgaos.uf,
-            arps.data_inicio_vigencia, arps.valor_total
-        FROM arps
-        JOIN orgaos ON arps.uasg_id = orgaos.uasg
-        WHERE arps.ata_excluido = FALSE
-        ORDER BY arps.created_at DESC
-        LIMIT 10
-    """)
-
-    recent = db.execute(recent_sql).fetchall()
-    recent_arps = [
-        {
-            "id": str(row.id),
-            "numero_arp": row.numero_arp,
-            "objeto": row.objeto[:100] + "..." if row.objeto and len(row.objeto) > 100 else row.objeto,
-            "orgao_nome": row.orgao_nome,
-            "uf": row.uf,
-            "data_inicio": str(row.data_inicio_vigencia) if row.data_inicio_vigencia else None,
-            "valor_total": float(row.valor_total) if row.valor_total else None
-        }
-        for row in recent
-    ]
-
-    # Top suppliers
-    suppliers_sql = text("""
-        SELECT
-            nome_fornecedor,
-            COUNT(DISTINCT arp_id) as contracts,
-            SUM(valor_total) as total_value
-        FROM itens_arp
-        WHERE item_excluido = FALSE
-        AND nome_fornecedor IS NOT NULL
-        GROUP BY nome_fornecedor
-        ORDER BY contracts DESC
-        LIMIT 10
-    """)
+    cached = await cache.redis_get(cache.STATS_CACHE_KEY)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    suppliers = db.execute(suppliers_sql).fetchall()
-    top_suppliers = [
-        {
-            "nome": row.nome_fornecedor,
-            "contracts": row.contracts,
-            "total_value": float(row.total_value) if row.total_value else 0.0
-        }
-        for row in suppliers
-    ]
+    body = (await db.execute(queries.STATS_SQL)).scalar().encode()
 
-    return DashboardStats(
-        total_arps=arp_stats.total or 0,
-        active_arps=arp_stats.active or 0,
-        total_items=items_stats.total or 0,
-        total_value=float(arp_stats.total_value) if arp_stats.total_value else 0.0,
-        arps_by_state=arps_by_state,
-        recent_arps=recent_arps,
-        top_suppliers=top_suppliers
-    )
+    await cache.redis_set(cache.STATS_CACHE_KEY, cache.STATS_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/fornecedores")
-def search_suppliers(
+async def search_suppliers(
     q: Optional[str] = None,
     limit: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_db)
 ):
     """Search suppliers"""
 
+    # Too short to search by substring: serve the (cached) top suppliers list
+    q = q.strip() if q else ""
+    if len(q) < MIN_SUBSTRING_QUERY_LEN:
+        q = ""
+
+    cache_key = f"sup:{q.lower()}:{limit}"
+    cached = await cache.redis_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     if q:
-        sql = text("""
-            SELECT
-                cnpj_fornecedor,
-                nome_fornecedor,
-                COUNT(DISTINCT arp_id) as total_contracts,
-                SUM(valor_total) as total_value,
-                AVG(valor_unitario) as avg_price
-            FROM itens_arp
-            WHERE item_excluido = FALSE
-            AND (nome_fornecedor ILIKE :q OR cnpj_fornecedor LIKE :cnpj)
-            GROUP BY cnpj_fornecedor, nome_fornecedor
-            ORDER BY total_contracts DESC
-            LIMIT :limit
-        """)
-        results = db.execute(sql, {"q": f"%{q}%", "cnpj": f"%{q}%", "limit": limit}).fetchall()
+        sql = queries.SUPPLIERS_SEARCH_SQL
+        results = (await db.execute(sql, {"q": f"%{q}%", "cnpj": f"%{q}%", "limit": limit})).mappings().all()
     else:
-        sql = text("""
-            SELECT
-                cnpj_fornecedor,
-                nome_fornecedor,
-                COUNT(DISTINCT arp_id) as total_contracts,
-                SUM(valor_total) as total_value,
-                AVG(valor_unitario) as avg_price
-            FROM itens_arp
-            WHERE item_excluido = FALSE
-            AND nome_fornecedor IS NOT NULL
-            GROUP BY cnpj_fornecedor, nome_fornecedor
-            ORDER BY total_contracts DESC
-            LIMIT :limit
-        """)
-        results = db.execute(sql, {"limit": limit}).fetchall()
-
-    return [
-        {
-            "cnpj": row.cnpj_fornecedor or "N/A",
-            "nome": row.nome_fornecedor or "N/A",
-            "total_contracts": row.total_contracts,
-            "total_value": float(row.total_value) if row.total_value else 0.0,
-            "avg_price": float(row.avg_price) if row.avg_price else 0.0
-        }
-        for row in results
-    ]
+        sql = queries.SUPPLIERS_TOP_SQL
+        results = (await db.execute(sql, {"limit": limit})).mappings().all()
+
+    body = orjson.dumps([dict(row) for row in results])
+    await cache.redis_set(cache_key, cache.SUPPLIERS_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/autocomplete")
-def autocomplete(
+async def autocomplete(
     q: str,
     limit: int = Query(default=10, ge=1, le=50),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_db)
 ):
     """Get autocomplete suggestions for item descriptions"""
 
-    sql = text("""
-        SELECT DISTINCT descricao
-        FROM itens_arp
-        WHERE item_excluido = FALSE
-        AND descricao ILIKE :q
-        LIMIT :limit
-    """)
+    q = q.strip()
+    if len(q) < MIN_SUBSTRING_QUERY_LEN:
+        return Response(content=b"[]", media_type="application/json")
 
-    results = db.execute(sql, {"q": f"%{q}%", "limit": limit}).fetchall()
+    cache_key = f"ac:{q.lower()}:{limit}"
+    cached = await cache.redis_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    return [row.descricao for row in results]
+    sql = queries.AUTOCOMPLETE_SQL
+    results = (await db.execute(sql, {"q": f"%{q}%", "term": q, "limit": limit})).scalars().all()
+
+    body = orjson.dumps(results)
+    await cache.redis_set(cache_key, cache.AUTOCOMPLETE_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/exportar")
-def export_search(
+async def export_search(
     q: str = "",
     ufs: Optional[str] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
-    limit: int = Query(default=1000, ge=1, le=5000),
-    db: Session = Depends(database.get_db)
+    limit: int = Query(default=1000, ge=1, le=5000)
 ):
-    """Export search results to CSV"""
+    """Export search results to CSV (streamed in batches from a server-side cursor)"""
 
     # Build query (similar to /buscar but without pagination)
-    where_clauses = ["arps.data_fim_vigencia >= CURRENT_DATE", "arps.ata_excluido = FALSE", "itens.item_excluido = FALSE"]
+    where_clauses = ["s.data_fim_vigencia >= CURRENT_DATE"]
     params = {"limit": limit}
 
     if q and q.strip():
-        where_clauses.append("itens.search_vector @@ plainto_tsquery('portuguese', :q)")
+        where_clauses.append(TSQUERY_CLAUSE)
         params["q"] = q
 
     if ufs:
-        uf_list = [uf.strip().upper() for uf in ufs.split(",")]
-        uf_str = ",".join([f"'{uf}'" for uf in uf_list])
-        where_clauses.append(f"orgaos.uf IN ({uf_str})")
+        where_clauses.append("s.uf = ANY(:ufs)")
+        params["ufs"] = [uf.strip().upper() for uf in ufs.split(",")]
 
     if min_price is not None:
-        where_clauses.append("itens.valor_unitario >= :min_price")
+        where_clauses.append("s.valor_unitario >= :min_price")
         params["min_price"] = min_price
 
     if max_price is not None:
-        where_clauses.append("itens.valor_unitario <= :max_price")
+        where_clauses.append("s.valor_unitario <= :max_price")
         params["max_price"] = max_price
 
     where_sql = " AND ".join(where_clauses)
 
-    sql = text(f"""
+    # numeric columns leave Postgres as text: same digits csv.writer would
+    # print from Decimal, without building a Decimal per row
+    sql = compiled_sql(f"""
         SELECT
-            arps.numero_arp,
-            orgaos.nome as orgao,
-            orgaos.uf,
-            itens.descricao,
-            itens.valor_unitario as preco,
-            itens.quantidade,
-            itens.unidade,
-            itens.marca,
-            itens.modelo,
-            itens.nome_fornecedor as fornecedor,
-            arps.data_inicio_vigencia,
-            arps.data_fim_vigencia
-        FROM itens_arp itens
-        JOIN arps ON itens.arp_id = arps.id
-        JOIN orgaos ON arps.uasg_id = orgaos.uasg
+            s.numero_arp,
+            s.orgao_nome as orgao,
+            s.uf,
+            s.descricao,
+            s.valor_unitario::text as preco,
+            s.quantidade::text as quantidade,
+            s.unidade,
+            s.marca,
+            s.modelo,
+            s.nome_fornecedor as fornecedor,
+            s.data_inicio_vigencia,
+            s.data_fim_vigencia
+        FROM mv_search_items s
         WHERE {where_sql}
-        ORDER BY arps.data_fim_vigencia DESC
+        ORDER BY s.data_fim_vigencia DESC
         LIMIT :limit
     """)
 
-    results = db.execute(sql, params).fetchall()
-
-    # Convert to DataFrame
-    df = pd.DataFrame([dict(row._mapping) for row in results])
-
-    # Create CSV in memory
-    output = io.StringIO()
-    df.to_csv(output, index=False, encoding='utf-8-sig')
-    output.seek(0)
-
     return StreamingResponse(
-        iter([output.getvalue()]),
+        stream_csv_rows(sql, params),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=atahub_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
     )
@@ -665,176 +652,57 @@ def export_search(
 # ============================================================================
 
 @app.get("/admin/etl/status", response_model=ETLStatusResponse)
-def get_etl_status(db: Session = Depends(database.get_db)):
+async def get_etl_status(db: AsyncSession = Depends(database.get_db)):
     """Get current or most recent ETL execution status"""
-    sql = text("""
-        SELECT
-            id, status, started_at,
-            last_ata_page_processed, total_ata_pages,
-            arps_inserted + arps_updated as arps_processed,
-            items_inserted + items_updated as items_processed,
-            errors_count, duration_seconds
-        FROM etl_executions
-        ORDER BY started_at DESC
-        LIMIT 1
-    """)
-
-    result = db.execute(sql).fetchone()
-
-    if not result:
-        return ETLStatusResponse(
-            execution_id=None,
-            status="never_run",
-            progress=None,
-            arps_processed=0,
-            items_processed=0,
-            errors=0,
-            duration_seconds=None,
-            started_at=None
-        )
-
-    progress = None
-    if result.total_ata_pages and result.last_ata_page_processed:
-        progress = f"{result.last_ata_page_processed}/{result.total_ata_pages}"
-
-    return ETLStatusResponse(
-        execution_id=str(result.id),
-        status=result.status,
-        progress=progress,
-        arps_processed=result.arps_processed or 0,
-        items_processed=result.items_processed or 0,
-        errors=result.errors_count or 0,
-        duration_seconds=result.duration_seconds,
-        started_at=str(result.started_at) if result.started_at else None
-    )
+    body = (await db.execute(queries.ETL_STATUS_SQL)).scalar()
+    return Response(content=body, media_type="application/json")
 
 @app.get("/admin/etl/executions", response_model=List[ETLExecutionSummary])
-def list_etl_executions(
-    limit: int = Query(default=10, ge=1, le=100),
-    db: Session = Depends(database.get_db)
+async def list_etl_executions(
+    limit: int = Query(default=10, ge=1, le=100)
 ):
     """List recent ETL executions"""
-    sql = text("""
-        SELECT
-            id, execution_type, status, started_at, completed_at,
-            duration_seconds,
-            arps_inserted + arps_updated as arps_processed,
-            items_inserted + items_updated as items_processed,
-            errors_count
-        FROM etl_executions
-        ORDER BY started_at DESC
-        LIMIT :limit
-    """)
+    sql = queries.ETL_EXECUTIONS_SQL
 
-    results = db.execute(sql, {"limit": limit}).fetchall()
-
-    return [
-        ETLExecutionSummary(
-            id=str(row.id),
-            execution_type=row.execution_type,
-            status=row.status,
-            started_at=str(row.started_at),
-            completed_at=str(row.completed_at) if row.completed_at else None,
-            duration_seconds=row.duration_seconds,
-            arps_processed=row.arps_processed or 0,
-            items_processed=row.items_processed or 0,
-            errors_count=row.errors_count or 0
-        )
-        for row in results
-    ]
+    return StreamingResponse(
+        stream_json_rows(sql, {"limit": limit}),
+        media_type="application/json"
+    )
 
 @app.get("/admin/etl/errors")
-def list_etl_errors(
+async def list_etl_errors(
     execution_id: Optional[str] = None,
-    limit: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(database.get_db)
+    limit: int = Query(default=50, ge=1, le=200)
 ):
     """List ETL errors (dead letter queue)"""
     if execution_id:
-        sql = text("""
-            SELECT
-                id, execution_id, error_type, error_message,
-                entity_type, entity_identifier, created_at, resolved
-            FROM etl_errors
-            WHERE execution_id = :execution_id
-            AND resolved = FALSE
-            ORDER BY created_at DESC
-            LIMIT :limit
-        """)
-        results = db.execute(sql, {"execution_id": execution_id, "limit": limit}).fetchall()
+        sql = queries.ETL_ERRORS_BY_EXECUTION_SQL
+        params = {"execution_id": execution_id, "limit": limit}
     else:
-        sql = text("""
-            SELECT
-                id, execution_id, error_type, error_message,
-                entity_type, entity_identifier, created_at, resolved
-            FROM etl_errors
-            WHERE resolved = FALSE
-            ORDER BY created_at DESC
-            LIMIT :limit
-        """)
-        results = db.execute(sql, {"limit": limit}).fetchall()
-
-    return [
-        {
-            "id": str(row.id),
-            "execution_id": str(row.execution_id),
-            "error_type": row.error_type,
-            "error_message": row.error_message,
-            "entity_type": row.entity_type,
-            "entity_identifier": row.entity_identifier,
-            "created_at": str(row.created_at),
-            "resolved": row.resolved
-        }
-        for row in results
-    ]
+        sql = queries.ETL_ERRORS_SQL
+        params = {"limit": limit}
 
-@app.get("/admin/etl/stats")
-def get_etl_stats(db: Session = Depends(database.get_db)):
-    """Get overall ETL statistics"""
-    stats_sql = text("""
-        SELECT
-            COUNT(*) as total_arps,
-            COUNT(*) FILTER (WHERE ata_excluido = FALSE) as active_arps,
-            COUNT(*) FILTER (WHERE data_fim_vigencia >= CURRENT_DATE AND ata_excluido = FALSE) as valid_arps,
-            MIN(data_inicio_vigencia) as oldest_arp,
-            MAX(data_fim_vigencia) as newest_arp
-        FROM arps
-    """)
+    return StreamingResponse(
+        stream_json_rows(sql, params),
+        media_type="application/json"
+    )
 
-    items_sql = text("""
-        SELECT
-            COUNT(*) as total_items,
-            COUNT(*) FILTER (WHERE item_excluido = FALSE) as active_items
-        FROM itens_arp
-    """)
+# Same shape as queries.ETL_SUMMARY_SQL, for a missing summary row
+EMPTY_ETL_SUMMARY = orjson.dumps({
+    "arps": {"total": 0, "active": 0, "valid": 0, "oldest_date": None, "newest_date": None},
+    "items": {"total": 0, "active": 0},
+    "executions": {"total": 0, "completed": 0, "failed": 0},
+    "refreshed_at": None,
+})
 
-    exec_sql = text("""
-        SELECT
-            COUNT(*) as total_executions,
-            COUNT(*) FILTER (WHERE status = 'completed') as completed,
-            COUNT(*) FILTER (WHERE status = 'failed') as failed
-        FROM etl_executions
-    """)
+@app.get("/admin/etl/stats")
+async def get_etl_stats(db: AsyncSession = Depends(database.get_db)):
+    """Get overall ETL statistics"""
+    body = (await db.execute(queries.ETL_SUMMARY_SQL)).scalar()
 
-    arps_stats = db.execute(stats_sql).fetchone()
-    items_stats = db.execute(items_sql).fetchone()
-    exec_stats = db.execute(exec_sql).fetchone()
+    # Migration 005 seeds the row and the ETL refreshes it; this read-only
+    # endpoint never recomputes it
+    if body is None:
+        body = EMPTY_ETL_SUMMARY
 
-    return {
-        "arps": {
-            "total": arps_stats.total_arps or 0,
-            "active": arps_stats.active_arps or 0,
-            "valid": arps_stats.valid_arps or 0,
-            "oldest_date": str(arps_stats.oldest_arp) if arps_stats.oldest_arp else None,
-            "newest_date": str(arps_stats.newest_arp) if arps_stats.newest_arp else None
-        },
-        "items": {
-            "total": items_stats.total_items or 0,
-            "active": items_stats.active_items or 0
-        },
-        "executions": {
-            "total": exec_stats.total_executions or 0,
-            "completed": exec_stats.completed or 0,
-            "failed": exec_stats.failed or 0
-        }
-    }
+    return Response(content=body, media_type="application/json")
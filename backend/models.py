@@ -1,18 +1,17 @@
-from sqlalchemy import Column, String, Date, Numeric, ForeignKey, Text, Integer, Index, Boolean, TIMESTAMP
+from sqlalchemy import Column, String, Date, Numeric, ForeignKey, Text, Integer, Index, Boolean, TIMESTAMP, Computed, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, TSVECTOR, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
 import uuid
-from datetime import datetime
 
 class Orgao(Base):
     __tablename__ = "orgaos"
     uasg = Column(String(10), primary_key=True)
     nome = Column(String(500))
     uf = Column(String(2))
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    updated_at = Column(TIMESTAMP, server_default=func.now(), server_onupdate=FetchedValue())
 
     arps = relationship("Arp", back_populates="orgao")
 
@@ -62,14 +61,18 @@ class Arp(Base):
     ata_excluido = Column(Boolean, default=False, index=True)
 
     # ETL tracking
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    updated_at = Column(TIMESTAMP, server_default=func.now(), server_onupdate=FetchedValue())
     last_synced_at = Column(TIMESTAMP)
 
     # Relationships
     orgao = relationship("Orgao", back_populates="arps")
     itens = relationship("ItemArp", back_populates="arp", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_arps_data_atualizacao_pncp', 'data_atualizacao_pncp'),
+    )
+
 class ItemArp(Base):
     __tablename__ = "itens_arp"
 
@@ -111,12 +114,18 @@ class ItemArp(Base):
     # Soft delete flag
     item_excluido = Column(Boolean, default=False, index=True)
 
-    # Full Text Search
-    search_vector = Column(TSVECTOR)
+    # Full Text Search (generated column, same expression as 001_enhanced_schema.sql)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('portuguese', coalesce(descricao, '')), 'A') || "
+        "setweight(to_tsvector('portuguese', coalesce(marca, '')), 'B') || "
+        "setweight(to_tsvector('portuguese', coalesce(modelo, '')), 'B') || "
+        "setweight(to_tsvector('portuguese', coalesce(nome_fornecedor, '')), 'C')",
+        persisted=True
+    ))
 
     # ETL tracking
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    updated_at = Column(TIMESTAMP, server_default=func.now(), server_onupdate=FetchedValue())
     last_synced_at = Column(TIMESTAMP)
 
     # Relationship
@@ -124,7 +133,9 @@ class ItemArp(Base):
 
     # Índice GIN para busca rápida
     __table_args__ = (
+        Index('idx_itens_arp_id', 'arp_id'),
         Index('idx_itens_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('idx_itens_arp_numero_item', 'arp_id', 'numero_item', unique=True),
     )
 
 class ETLExecution(Base):
@@ -136,7 +147,7 @@ class ETLExecution(Base):
     status = Column(String(20), nullable=False)  # 'running', 'completed', 'failed'
 
     # Timing
-    started_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    started_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
     completed_at = Column(TIMESTAMP)
     duration_seconds = Column(Integer)
 
@@ -167,7 +178,7 @@ class ETLExecution(Base):
     # Configuration snapshot
     config_snapshot = Column(JSONB)
 
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=func.now())
 
     # Relationship
     errors = relationship("ETLError", back_populates="execution", cascade="all, delete-orphan")
@@ -195,7 +206,11 @@ class ETLError(Base):
     last_retry_at = Column(TIMESTAMP)
     resolved = Column(Boolean, default=False)
 
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=func.now())
 
     # Relationship
     execution = relationship("ETLExecution", back_populates="errors")
+
+    __table_args__ = (
+        Index('idx_etl_errors_execution', 'execution_id'),
+    )
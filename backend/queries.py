@@ -0,0 +1,285 @@
+"""
+Static SQL used by the API endpoints.
+
+Compiled once at import time instead of rebuilding a TextClause per request.
+Queries whose WHERE/ORDER BY depend on request filters (/buscar, /comparar,
+/exportar) are still assembled in main.py.
+"""
+from sqlalchemy import text
+
+# --- Health ---
+
+HEALTHCHECK_SQL = text("SELECT 1")
+
+# --- Search ---
+
+TSQUERY_NUMNODE_SQL = text("SELECT numnode(websearch_to_tsquery('portuguese', :q))")
+
+# --- ARP detail ---
+
+# Whole ArpDetail document (ARP + items) shaped as JSON in one round trip
+ARP_DETAIL_SQL = text("""
+    SELECT json_build_object(
+        'id', arps.id,
+        'numero_arp', COALESCE(arps.numero_arp, ''),
+        'numero_compra', COALESCE(arps.numero_compra, ''),
+        'orgao_nome', COALESCE(orgaos.nome, ''),
+        'uf', orgaos.uf,
+        'data_inicio_vigencia', arps.data_inicio_vigencia,
+        'data_fim_vigencia', arps.data_fim_vigencia,
+        'objeto', COALESCE(arps.objeto, ''),
+        'valor_total', NULLIF(arps.valor_total, 0)::float8,
+        'quantidade_itens', items.quantidade_itens,
+        'situacao', arps.situacao,
+        'modalidade', arps.modalidade,
+        'link_ata_pncp', arps.link_ata_pncp,
+        'itens', COALESCE(items.itens, '[]'::json)
+    )::text
+    FROM arps
+    LEFT JOIN orgaos ON arps.uasg_id = orgaos.uasg
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) as quantidade_itens,
+            json_agg(json_build_object(
+                'id', itens_arp.id,
+                'numero_item', COALESCE(itens_arp.numero_item, 0),
+                'descricao', COALESCE(itens_arp.descricao, ''),
+                'valor_unitario', COALESCE(itens_arp.valor_unitario, 0)::float8,
+                'valor_total', NULLIF(itens_arp.valor_total, 0)::float8,
+                'quantidade', COALESCE(itens_arp.quantidade, 0)::float8,
+                'unidade', itens_arp.unidade,
+                'marca', itens_arp.marca,
+                'modelo', itens_arp.modelo,
+                'fornecedor', itens_arp.nome_fornecedor,
+                'cnpj_fornecedor', itens_arp.cnpj_fornecedor
+            ) ORDER BY itens_arp.numero_item) as itens
+        FROM itens_arp
+        WHERE itens_arp.arp_id = arps.id AND itens_arp.item_excluido = FALSE
+    ) items
+    WHERE arps.id = :arp_id
+""")
+
+# --- Dashboard (/stats) ---
+
+# Whole DashboardStats document in one query (one round trip, one connection).
+# Supplier aggregates come from mv_supplier_rollup (migration 008).
+STATS_SQL = text("""
+    WITH arp_stats AS (
+        SELECT
+            COUNT(*) as total,
+            COUNT(*) FILTER (WHERE data_fim_vigencia >= CURRENT_DATE) as active,
+            COALESCE(SUM(valor_total), 0)::float8 as total_value
+        FROM arps
+        WHERE ata_excluido = FALSE
+    ),
+    item_stats AS (
+        SELECT COUNT(*) as total
+        FROM itens_arp
+        WHERE item_excluido = FALSE
+    ),
+    by_state AS (
+        SELECT orgaos.uf, COUNT(*) as count
+        FROM arps
+        JOIN orgaos ON arps.uasg_id = orgaos.uasg
+        WHERE arps.ata_excluido = FALSE
+        AND arps.data_fim_vigencia >= CURRENT_DATE
+        AND orgaos.uf <> ''
+        GROUP BY orgaos.uf
+    ),
+    recent AS (
+        SELECT
+            arps.created_at,
+            json_build_object(
+                'id', arps.id,
+                'numero_arp', arps.numero_arp,
+                'objeto', CASE WHEN length(arps.objeto) > 100
+                               THEN left(arps.objeto, 100) || '...'
+                               ELSE arps.objeto END,
+                'orgao_nome', orgaos.nome,
+                'uf', orgaos.uf,
+                'data_inicio', arps.data_inicio_vigencia,
+                'valor_total', NULLIF(arps.valor_total, 0)::float8
+            ) as doc
+        FROM arps
+        JOIN orgaos ON arps.uasg_id = orgaos.uasg
+        WHERE arps.ata_excluido = FALSE
+        ORDER BY arps.created_at DESC
+        LIMIT 10
+    ),
+    suppliers AS (
+        SELECT
+            total_contracts,
+            json_build_object(
+                'nome', nome_fornecedor,
+                'contracts', total_contracts,
+                'total_value', total_value::float8
+            ) as doc
+        FROM mv_supplier_rollup
+        WHERE nome_fornecedor <> ''
+        ORDER BY total_contracts DESC
+        LIMIT 10
+    )
+    SELECT json_build_object(
+        'total_arps', arp_stats.total,
+        'active_arps', arp_stats.active,
+        'total_items', item_stats.total,
+        'total_value', arp_stats.total_value,
+        'arps_by_state', (SELECT COALESCE(json_object_agg(uf, count ORDER BY count DESC), '{}'::json) FROM by_state),
+        'recent_arps', (SELECT COALESCE(json_agg(doc ORDER BY created_at DESC), '[]'::json) FROM recent),
+        'top_suppliers', (SELECT COALESCE(json_agg(doc ORDER BY total_contracts DESC), '[]'::json) FROM suppliers)
+    )::text
+    FROM arp_stats, item_stats
+""")
+
+# --- Suppliers / autocomplete ---
+
+SUPPLIERS_SEARCH_SQL = text("""
+    SELECT
+        COALESCE(NULLIF(cnpj_fornecedor, ''), 'N/A') as cnpj,
+        COALESCE(NULLIF(nome_fornecedor, ''), 'N/A') as nome,
+        total_contracts,
+        total_value::float8 as total_value,
+        avg_price::float8 as avg_price
+    FROM mv_supplier_rollup
+    WHERE nome_fornecedor ILIKE :q OR cnpj_fornecedor LIKE :cnpj
+    ORDER BY total_contracts DESC
+    LIMIT :limit
+""")
+
+SUPPLIERS_TOP_SQL = text("""
+    SELECT
+        COALESCE(NULLIF(cnpj_fornecedor, ''), 'N/A') as cnpj,
+        COALESCE(NULLIF(nome_fornecedor, ''), 'N/A') as nome,
+        total_contracts,
+        total_value::float8 as total_value,
+        avg_price::float8 as avg_price
+    FROM mv_supplier_rollup
+    WHERE nome_fornecedor <> ''
+    ORDER BY total_contracts DESC
+    LIMIT :limit
+""")
+
+# Trigram-indexed substring match (idx_mv_search_items_descricao_trgm), closest first
+AUTOCOMPLETE_SQL = text("""
+    SELECT descricao
+    FROM (
+        SELECT DISTINCT descricao
+        FROM mv_search_items
+        WHERE descricao ILIKE :q
+    ) matches
+    ORDER BY descricao <-> :term, descricao
+    LIMIT :limit
+""")
+
+# --- ETL admin ---
+
+# Latest execution as an ETLStatusResponse document ("never_run" when empty)
+ETL_STATUS_SQL = text("""
+    SELECT COALESCE(
+        (
+            SELECT json_build_object(
+                'execution_id', id,
+                'status', status,
+                'progress', CASE WHEN total_ata_pages > 0 AND last_ata_page_processed > 0
+                                 THEN last_ata_page_processed || '/' || total_ata_pages END,
+                'arps_processed', COALESCE(arps_inserted + arps_updated, 0),
+                'items_processed', COALESCE(items_inserted + items_updated, 0),
+                'errors', COALESCE(errors_count, 0),
+                'duration_seconds', duration_seconds,
+                'started_at', started_at
+            )
+            FROM etl_executions
+            ORDER BY started_at DESC
+            LIMIT 1
+        ),
+        json_build_object(
+            'execution_id', NULL,
+            'status', 'never_run',
+            'progress', NULL,
+            'arps_processed', 0,
+            'items_processed', 0,
+            'errors', 0,
+            'duration_seconds', NULL,
+            'started_at', NULL
+        )
+    )::text
+""")
+
+# ETL list rows are shaped as JSON text by Postgres and streamed as-is
+ETL_EXECUTIONS_SQL = text("""
+    SELECT json_build_object(
+        'id', id,
+        'execution_type', execution_type,
+        'status', status,
+        'started_at', started_at,
+        'completed_at', completed_at,
+        'duration_seconds', duration_seconds,
+        'arps_processed', COALESCE(arps_inserted + arps_updated, 0),
+        'items_processed', COALESCE(items_inserted + items_updated, 0),
+        'errors_count', COALESCE(errors_count, 0)
+    )::text
+    FROM etl_executions
+    ORDER BY started_at DESC
+    LIMIT :limit
+""")
+
+ETL_ERRORS_BY_EXECUTION_SQL = text("""
+    SELECT json_build_object(
+        'id', id,
+        'execution_id', execution_id,
+        'error_type', error_type,
+        'error_message', error_message,
+        'entity_type', entity_type,
+        'entity_identifier', entity_identifier,
+        'created_at', created_at,
+        'resolved', resolved
+    )::text
+    FROM etl_errors
+    WHERE execution_id = :execution_id
+    AND resolved = FALSE
+    ORDER BY created_at DESC
+    LIMIT :limit
+""")
+
+ETL_ERRORS_SQL = text("""
+    SELECT json_build_object(
+        'id', id,
+        'execution_id', execution_id,
+        'error_type', error_type,
+        'error_message', error_message,
+        'entity_type', entity_type,
+        'entity_identifier', entity_identifier,
+        'created_at', created_at,
+        'resolved', resolved
+    )::text
+    FROM etl_errors
+    WHERE resolved = FALSE
+    ORDER BY created_at DESC
+    LIMIT :limit
+""")
+
+# Maintained by the ETL via refresh_etl_summary() (migration 005);
+# returned as the /admin/etl/stats document
+ETL_SUMMARY_SQL = text("""
+    SELECT json_build_object(
+        'arps', json_build_object(
+            'total', total_arps,
+            'active', active_arps,
+            'valid', valid_arps,
+            'oldest_date', oldest_arp,
+            'newest_date', newest_arp
+        ),
+        'items', json_build_object(
+            'total', total_items,
+            'active', active_items
+        ),
+        'executions', json_build_object(
+            'total', total_executions,
+            'completed', completed,
+            'failed', failed
+        ),
+        'refreshed_at', refreshed_at
+    )::text
+    FROM etl_summary
+    WHERE id = 1
+""")
@@ -3,48 +3,26 @@
 import psycopg2
 from config import config
 
-# Parse connection string
-db_url = config.DATABASE_URL
-parts = db_url.replace('postgresql://', '').split('@')
-user_pass = parts[0].split(':')
-host_port_db = parts[1].split('/')
-host_port = host_port_db[0].split(':')
-
-user = user_pass[0]
-password = user_pass[1] if len(user_pass) > 1 else ''
-host = host_port[0]
-port = host_port[1] if len(host_port) > 1 else '5432'
-database = host_port_db[1]
-
-# Connect
-conn = psycopg2.connect(
-    host=host,
-    port=port,
-    database=database,
-    user=user,
-    password=password
-)
+# Connect (same as check_schema.py): libpq parses the URL, including
+# percent-encoded '@' or ':' in the password
+conn = psycopg2.connect(config.DATABASE_URL)
 
 cur = conn.cursor()
 
-# Query data
-cur.execute('SELECT COUNT(*) FROM arps')
-total_arps = cur.fetchone()[0]
-
+# Query data (all counts in one round trip)
 cur.execute(
-    'SELECT COUNT(*) FROM arps WHERE data_atualizacao_pncp >= %s AND data_atualizacao_pncp < %s',
+    """
+    SELECT
+        (SELECT COUNT(*) FROM arps),
+        (SELECT COUNT(*) FROM arps
+         WHERE data_atualizacao_pncp >= %s AND data_atualizacao_pncp < %s),
+        (SELECT COUNT(*) FROM orgaos),
+        (SELECT COUNT(*) FROM itens_arp),
+        (SELECT COUNT(*) FROM etl_executions)
+    """,
     ('2025-11-01', '2025-12-01')
 )
-nov_arps = cur.fetchone()[0]
-
-cur.execute('SELECT COUNT(*) FROM orgaos')
-total_orgaos = cur.fetchone()[0]
-
-cur.execute('SELECT COUNT(*) FROM itens_arp')
-total_itens = cur.fetchone()[0]
-
-cur.execute('SELECT COUNT(*) FROM etl_executions')
-executions = cur.fetchone()[0]
+total_arps, nov_arps, total_orgaos, total_itens, executions = cur.fetchone()
 
 cur.execute('''
     SELECT id, execution_type, status, started_at, arps_fetched, arps_inserted, errors_count
@@ -6,6 +6,7 @@ All configuration is loaded from environment variables or .env file.
 """
 
 from typing import Optional
+from functools import lru_cache, cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from datetime import date
 
@@ -34,6 +35,9 @@ class ETLConfig(BaseSettings):
     DB_POOL_RECYCLE: int = 3600
     """Recycle connections after N seconds"""
 
+    REDIS_URL: Optional[str] = None
+    """Redis shared with the API; cached aggregates are invalidated after each run (None = disabled)"""
+
     # ========================================================================
     # API CONFIGURATION
     # ========================================================================
@@ -48,7 +52,7 @@ class ETLConfig(BaseSettings):
     """Endpoint for fetching ARP items"""
 
     API_TIMEOUT: int = 30
-    """HTTP request timeout in seconds"""
+    """HTTP socket read timeout in seconds (per read, not per request)"""
 
     REQUESTS_PER_SECOND: float = 3.0
     """Rate limit: maximum requests per second (conservative for unknown API limits)"""
@@ -57,7 +61,7 @@ class ETLConfig(BaseSettings):
     """Maximum retry attempts for failed API requests"""
 
     RETRY_BACKOFF_FACTOR: float = 2.0
-    """Exponential backoff factor: wait = (backoff_factor ** attempt) seconds"""
+    """Exponential backoff factor: wait = random(0, backoff_factor ** attempt) seconds"""
 
     # ========================================================================
     # ETL DATE RANGES
@@ -92,6 +96,9 @@ class ETLConfig(BaseSettings):
     MAX_CONCURRENT_ITEM_REQUESTS: int = 5
     """Maximum concurrent requests for fetching items (semaphore limit)"""
 
+    MAX_CONCURRENT_ITEM_PAGES: int = 4
+    """Maximum concurrent page requests within one ARP's item listing (pages 2..N)"""
+
     MAX_CONCURRENT_DB_OPERATIONS: int = 3
     """Maximum concurrent database operations"""
 
@@ -193,12 +200,12 @@ class ETLConfig(BaseSettings):
     # COMPUTED PROPERTIES
     # ========================================================================
 
-    @property
+    @cached_property
     def arp_endpoint_url(self) -> str:
         """Full URL for ARP endpoint"""
         return f"{self.API_BASE_URL}{self.API_ENDPOINT_ARPS}"
 
-    @property
+    @cached_property
     def item_endpoint_url(self) -> str:
         """Full URL for item endpoint"""
         return f"{self.API_BASE_URL}{self.API_ENDPOINT_ITEMS}"
@@ -206,9 +213,10 @@ class ETLConfig(BaseSettings):
     @property
     def initial_end_date(self) -> date:
         """End date for initial load (defaults to today if not set)"""
+        # Not cached: date.today() changes under the long-running scheduler
         return self.INITIAL_LOAD_END_DATE or date.today()
 
-    @property
+    @cached_property
     def rate_limit_delay(self) -> float:
         """Delay between requests in seconds"""
         return 1.0 / self.REQUESTS_PER_SECOND if self.REQUESTS_PER_SECOND > 0 else 0
@@ -236,6 +244,9 @@ class ETLConfig(BaseSettings):
         if self.MAX_CONCURRENT_ITEM_REQUESTS < 1:
             raise ValueError("MAX_CONCURRENT_ITEM_REQUESTS must be greater than 0")
 
+        if self.MAX_CONCURRENT_ITEM_PAGES < 1:
+            raise ValueError("MAX_CONCURRENT_ITEM_PAGES must be greater than 0")
+
         if self.ETL_SCHEDULE_HOUR < 0 or self.ETL_SCHEDULE_HOUR > 23:
             raise ValueError("ETL_SCHEDULE_HOUR must be between 0 and 23")
 
@@ -269,12 +280,17 @@ class ETLConfig(BaseSettings):
 # GLOBAL CONFIG INSTANCE
 # ============================================================================
 
-# Singleton instance of configuration
-# Import this in other modules: from config import config
-config = ETLConfig()
+@lru_cache(maxsize=1)
+def _build_config() -> ETLConfig:
+    """Read and validate settings once per process (until reload_config)"""
+    cfg = ETLConfig()
+    cfg.validate_config()
+    return cfg
 
-# Validate on import
-config.validate_config()
+
+# Singleton instance of configuration, validated on import
+# Import this in other modules: from config import config
+config = _build_config()
 
 
 # ============================================================================
@@ -288,7 +304,7 @@ def get_config() -> ETLConfig:
     Returns:
         ETLConfig instance
     """
-    return config
+    return _build_config()
 
 
 def reload_config() -> ETLConfig:
@@ -299,8 +315,8 @@ def reload_config() -> ETLConfig:
         New ETLConfig instance
     """
     global config
-    config = ETLConfig()
-    config.validate_config()
+    _build_config.cache_clear()
+    config = _build_config()
     return config
 
 
@@ -6,7 +6,8 @@ Uses asyncpg for high-performance PostgreSQL access.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
@@ -18,6 +19,9 @@ from sqlalchemy import text
 from config import config
 import structlog
 
+# Level filtering and logger caching are configured by the entry points
+# (run_*.py, scheduler.py), so below-threshold logger.debug() calls are no-ops.
+# Don't bind() here: this module is imported before structlog.configure() runs.
 logger = structlog.get_logger(__name__)
 
 
@@ -126,6 +130,30 @@ async def get_db_session():
 # BULK OPERATIONS
 # ============================================================================
 
+# The bulk writes below run on the session's asyncpg connection directly
+# (positional $n parameters, no SQLAlchemy statement compilation); the session
+# only supplies the connection and owns the transaction.
+ORGAO_UPSERT_COLUMNS = ("uasg", "nome", "uf")
+ORGAO_RECORD = itemgetter(*ORGAO_UPSERT_COLUMNS)
+
+ORGAO_UPSERT_SQL = """
+    INSERT INTO orgaos (uasg, nome, uf, created_at, updated_at)
+    VALUES ($1, $2, $3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT (uasg)
+    DO UPDATE SET
+        nome = EXCLUDED.nome,
+        uf = EXCLUDED.uf,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+async def _driver_connection(session: AsyncSession):
+    """asyncpg connection behind the session's current transaction"""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
 async def bulk_upsert_orgaos(session: AsyncSession, orgaos: List[Dict[str, Any]]) -> int:
     """
     Bulk insert/update organizations (orgaos)
@@ -140,18 +168,9 @@ async def bulk_upsert_orgaos(session: AsyncSession, orgaos: List[Dict[str, Any]]
     if not orgaos:
         return 0
 
-    query = text("""
-        INSERT INTO orgaos (uasg, nome, uf, created_at, updated_at)
-        VALUES (:uasg, :nome, :uf, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-        ON CONFLICT (uasg)
-        DO UPDATE SET
-            nome = EXCLUDED.nome,
-            uf = EXCLUDED.uf,
-            updated_at = CURRENT_TIMESTAMP
-    """)
-
     try:
-        await session.execute(query, orgaos)
+        driver_connection = await _driver_connection(session)
+        await driver_connection.executemany(ORGAO_UPSERT_SQL, list(map(ORGAO_RECORD, orgaos)))
         logger.debug("bulk_upsert_orgaos_success", count=len(orgaos))
         return len(orgaos)
     except Exception as e:
@@ -159,10 +178,200 @@ async def bulk_upsert_orgaos(session: AsyncSession, orgaos: List[Dict[str, Any]]
         raise
 
 
+ARP_UPSERT_COLUMNS = (
+    "id", "codigo_arp_api", "numero_arp", "numero_compra", "ano_compra",
+    "uasg_id", "data_inicio_vigencia", "data_fim_vigencia", "data_assinatura",
+    "data_atualizacao_pncp", "objeto", "valor_total", "quantidade_itens",
+    "situacao", "modalidade", "nome_modalidade", "numero_controle_pncp_compra",
+    "numero_controle_pncp_ata", "link_ata_pncp", "link_compra_pncp", "id_compra",
+    "codigo_orgao", "nome_orgao", "ata_excluido",
+)
+
+ARP_UPDATE_COLUMNS = (
+    "numero_arp", "numero_compra", "ano_compra", "data_inicio_vigencia",
+    "data_fim_vigencia", "data_assinatura", "data_atualizacao_pncp", "objeto",
+    "valor_total", "quantidade_itens", "situacao", "modalidade", "nome_modalidade",
+    "link_ata_pncp", "link_compra_pncp", "ata_excluido",
+)
+
+ITEM_UPSERT_COLUMNS = (
+    "id", "arp_id", "numero_item", "codigo_item", "descricao", "tipo_item",
+    "valor_unitario", "valor_total", "quantidade", "unidade",
+    "marca", "modelo", "classificacao_fornecedor", "cnpj_fornecedor", "nome_fornecedor",
+    "situacao_sicaf", "codigo_pdm", "nome_pdm", "quantidade_empenhada",
+    "percentual_maior_desconto", "maximo_adesao", "item_excluido",
+)
+
+ITEM_UPDATE_COLUMNS = (
+    "descricao", "tipo_item", "valor_unitario", "valor_total", "quantidade",
+    "unidade", "marca", "modelo", "classificacao_fornecedor", "cnpj_fornecedor",
+    "nome_fornecedor", "situacao_sicaf", "quantidade_empenhada",
+    "percentual_maior_desconto", "item_excluido",
+)
+
+
+
+def _stage_reset_sql(stage_table: str, source_table: str) -> str:
+    """
+    Create (once per connection) and empty a temp stage table
+
+    Sent through asyncpg's argument-less execute(), which runs it as one
+    simple-protocol script: both statements in one round trip.
+    """
+    return f"""
+        CREATE TEMP TABLE IF NOT EXISTS {stage_table}
+        (LIKE {source_table}) ON COMMIT DELETE ROWS;
+        TRUNCATE {stage_table};
+    """
+
+
+def _upsert_from_stage_sql(
+    table: str,
+    stage_table: str,
+    columns: Tuple[str, ...],
+    conflict_columns: Tuple[str, ...],
+    update_columns: Tuple[str, ...],
+    skip_unchanged: bool = False,
+    returning: Tuple[str, ...] = ()
+) -> str:
+    """
+    INSERT ... SELECT from the stage table, ON CONFLICT DO UPDATE
+
+    With skip_unchanged, conflicting rows whose update columns all match the
+    stored values are left alone: no new row version, WAL or index entries.
+    With returning, the statement returns those columns of each written row.
+    """
+    unchanged_filter = ""
+    if skip_unchanged:
+        unchanged_filter = (
+            f"WHERE ({', '.join(f'{table}.{column}' for column in update_columns)})"
+            f" IS DISTINCT FROM ({', '.join(f'EXCLUDED.{column}' for column in update_columns)})"
+        )
+
+    returning_clause = f"RETURNING {', '.join(returning)}" if returning else ""
+
+    return f"""
+        INSERT INTO {table} ({", ".join(columns)}, created_at, updated_at, last_synced_at)
+        SELECT {", ".join(columns)}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+        FROM {stage_table}
+        ON CONFLICT ({", ".join(conflict_columns)})
+        DO UPDATE SET
+            {", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)},
+            updated_at = CURRENT_TIMESTAMP,
+            last_synced_at = CURRENT_TIMESTAMP
+        {unchanged_filter}
+        {returning_clause}
+    """
+
+
+# ARPs and items are COPYed in binary into per-connection temp tables, then
+# upserted with one INSERT ... SELECT: values go through asyncpg's native
+# codecs (date, numeric, uuid) with no per-value bind parameters, and each
+# batch is one statement regardless of its size.
+#
+# Re-synced items are mostly unchanged, and every update recomputes the
+# generated search_vector and rewrites its GIN entries, so items skip no-op
+# updates (their last_synced_at then keeps the last change). ARPs always
+# update: arps.last_synced_at drives incremental updates.
+#
+# Transformed rows carry a fresh uuid4 id, but a re-synced ARP keeps its stored
+# arps.id (the conflict is on codigo_arp_api). The ARP upsert returns the stored
+# ids so items built afterwards reference the row that actually exists.
+ARP_RECORD = itemgetter(*ARP_UPSERT_COLUMNS)
+ARP_KEY = itemgetter("codigo_arp_api")
+ARP_STAGE_TABLE = "arps_stage"
+ARP_STAGE_RESET_SQL = _stage_reset_sql(ARP_STAGE_TABLE, "arps")
+ARP_UPSERT_FROM_STAGE_SQL = _upsert_from_stage_sql(
+    "arps", ARP_STAGE_TABLE, ARP_UPSERT_COLUMNS, ("codigo_arp_api",), ARP_UPDATE_COLUMNS,
+    returning=("codigo_arp_api", "id")
+)
+
+ITEM_RECORD = itemgetter(*ITEM_UPSERT_COLUMNS)
+ITEM_STAGE_TABLE = "itens_arp_stage"
+ITEM_STAGE_RESET_SQL = _stage_reset_sql(ITEM_STAGE_TABLE, "itens_arp")
+ITEM_UPSERT_FROM_STAGE_SQL = _upsert_from_stage_sql(
+    "itens_arp", ITEM_STAGE_TABLE, ITEM_UPSERT_COLUMNS, ("arp_id", "numero_item"), ITEM_UPDATE_COLUMNS,
+    skip_unchanged=True
+)
+
+
+def _upsert_records(
+    rows: List[Dict[str, Any]],
+    record: Callable[[Dict[str, Any]], Tuple[Any, ...]],
+    key: Callable[[Dict[str, Any]], Any]
+) -> List[Tuple[Any, ...]]:
+    """
+    Rows as tuples in column order, keeping the last row per conflict key
+
+    Postgres rejects an INSERT ... ON CONFLICT DO UPDATE that touches the same
+    row twice, which a single multi-row statement would do for repeated keys.
+
+    record is one of the module-level *_RECORD itemgetters: the transformers
+    emit every column key, so one C-level call builds each tuple.
+    """
+    unique = {}
+    for row in rows:
+        unique[key(row)] = record(row)
+    return list(unique.values())
+
+
+async def _copy_to_stage(
+    session: AsyncSession,
+    stage_table: str,
+    stage_reset_sql: str,
+    columns: Tuple[str, ...],
+    records: List[Tuple[Any, ...]]
+):
+    """
+    COPY records into a stage table, returning the asyncpg connection
+
+    The stage table lives per connection; earlier batches of this
+    transaction may still be in it, hence the reset.
+    """
+    driver_connection = await _driver_connection(session)
+    await driver_connection.execute(stage_reset_sql)
+    await driver_connection.copy_records_to_table(
+        stage_table,
+        records=records,
+        columns=list(columns)
+    )
+    return driver_connection
+
+
+async def _copy_upsert(
+    session: AsyncSession,
+    stage_table: str,
+    stage_reset_sql: str,
+    columns: Tuple[str, ...],
+    records: List[Tuple[Any, ...]],
+    upsert_sql: str
+) -> int:
+    """
+    COPY records into a stage table and upsert them into the real table
+
+    Returns:
+        Number of rows inserted or updated
+    """
+    driver_connection = await _copy_to_stage(
+        session, stage_table, stage_reset_sql, columns, records
+    )
+
+    # Command tag "INSERT 0 <rows>"
+    status = await driver_connection.execute(upsert_sql)
+    return int(status.rsplit(" ", 1)[1])
+
+
 async def bulk_upsert_arps(session: AsyncSession, arps: List[Dict[str, Any]]) -> int:
     """
     Bulk insert/update ARPs with UPSERT logic
 
+    Rows go through COPY into ARP_STAGE_TABLE and a single
+    INSERT ... SELECT ... ON CONFLICT (codigo_arp_api) from there.
+
+    Each dict's "id" is then set to the stored arps.id: an ARP already in the
+    database keeps its id, not the one generated by the transform, and items
+    (transform_items_batch(..., arp["id"])) must reference the stored one.
+
     Args:
         session: Database session
         arps: List of ARP dictionaries
@@ -173,49 +382,20 @@ async def bulk_upsert_arps(session: AsyncSession, arps: List[Dict[str, Any]]) ->
     if not arps:
         return 0
 
-    query = text("""
-        INSERT INTO arps (
-            id, codigo_arp_api, numero_arp, numero_compra, ano_compra,
-            uasg_id, data_inicio_vigencia, data_fim_vigencia, data_assinatura,
-            data_atualizacao_pncp, objeto, valor_total, quantidade_itens,
-            situacao, modalidade, nome_modalidade, numero_controle_pncp_compra,
-            numero_controle_pncp_ata, link_ata_pncp, link_compra_pncp, id_compra,
-            codigo_orgao, nome_orgao, ata_excluido, created_at, updated_at, last_synced_at
-        )
-        VALUES (
-            :id, :codigo_arp_api, :numero_arp, :numero_compra, :ano_compra,
-            :uasg_id, :data_inicio_vigencia, :data_fim_vigencia, :data_assinatura,
-            :data_atualizacao_pncp, :objeto, :valor_total, :quantidade_itens,
-            :situacao, :modalidade, :nome_modalidade, :numero_controle_pncp_compra,
-            :numero_controle_pncp_ata, :link_ata_pncp, :link_compra_pncp, :id_compra,
-            :codigo_orgao, :nome_orgao, :ata_excluido, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-        )
-        ON CONFLICT (codigo_arp_api)
-        DO UPDATE SET
-            numero_arp = EXCLUDED.numero_arp,
-            numero_compra = EXCLUDED.numero_compra,
-            ano_compra = EXCLUDED.ano_compra,
-            data_inicio_vigencia = EXCLUDED.data_inicio_vigencia,
-            data_fim_vigencia = EXCLUDED.data_fim_vigencia,
-            data_assinatura = EXCLUDED.data_assinatura,
-            data_atualizacao_pncp = EXCLUDED.data_atualizacao_pncp,
-            objeto = EXCLUDED.objeto,
-            valor_total = EXCLUDED.valor_total,
-            quantidade_itens = EXCLUDED.quantidade_itens,
-            situacao = EXCLUDED.situacao,
-            modalidade = EXCLUDED.modalidade,
-            nome_modalidade = EXCLUDED.nome_modalidade,
-            link_ata_pncp = EXCLUDED.link_ata_pncp,
-            link_compra_pncp = EXCLUDED.link_compra_pncp,
-            ata_excluido = EXCLUDED.ata_excluido,
-            updated_at = CURRENT_TIMESTAMP,
-            last_synced_at = CURRENT_TIMESTAMP
-    """)
+    records = _upsert_records(arps, ARP_RECORD, key=ARP_KEY)
 
     try:
-        await session.execute(query, arps)
-        logger.debug("bulk_upsert_arps_success", count=len(arps))
-        return len(arps)
+        driver_connection = await _copy_to_stage(
+            session, ARP_STAGE_TABLE, ARP_STAGE_RESET_SQL, ARP_UPSERT_COLUMNS, records
+        )
+        stored = await driver_connection.fetch(ARP_UPSERT_FROM_STAGE_SQL)
+        stored_ids = {row["codigo_arp_api"]: str(row["id"]) for row in stored}
+        for arp in arps:
+            arp["id"] = stored_ids.get(arp["codigo_arp_api"], arp["id"])
+
+        count = len(stored)
+        logger.debug("bulk_upsert_arps_success", count=count)
+        return count
     except Exception as e:
         logger.error("bulk_upsert_arps_error", error=str(e), count=len(arps))
         raise
@@ -225,60 +405,40 @@ async def bulk_upsert_items(session: AsyncSession, items: List[Dict[str, Any]])
     """
     Bulk insert/update ARP items
 
+    Items are matched on their natural key (arp_id, numero_item), unique since
+    migration 013: item ids are generated per transform, so re-syncing an ARP
+    updates its items instead of duplicating them. This relies on arp_id being
+    the stored arps.id, which bulk_upsert_arps writes back into the ARP dicts
+    the items are built from. Items without numero_item cannot conflict and
+    are always inserted.
+
+    Rows go through COPY into ITEM_STAGE_TABLE and a single
+    INSERT ... SELECT ... ON CONFLICT from there.
+
     Args:
         session: Database session
         items: List of item dictionaries
 
     Returns:
-        Number of records processed
+        Number of records inserted or changed
     """
     if not items:
         return 0
 
-    # Note: Using a unique constraint on (arp_id, numero_item, codigo_item) would be ideal
-    # For now, we'll use id if provided, or generate new UUID
-    query = text("""
-        INSERT INTO itens_arp (
-            id, arp_id, numero_item, codigo_item, descricao, tipo_item,
-            valor_unitario, valor_total, quantidade, unidade,
-            marca, modelo, classificacao_fornecedor, cnpj_fornecedor, nome_fornecedor,
-            situacao_sicaf, codigo_pdm, nome_pdm, quantidade_empenhada,
-            percentual_maior_desconto, maximo_adesao, item_excluido,
-            created_at, updated_at, last_synced_at
-        )
-        VALUES (
-            :id, :arp_id, :numero_item, :codigo_item, :descricao, :tipo_item,
-            :valor_unitario, :valor_total, :quantidade, :unidade,
-            :marca, :modelo, :classificacao_fornecedor, :cnpj_fornecedor, :nome_fornecedor,
-            :situacao_sicaf, :codigo_pdm, :nome_pdm, :quantidade_empenhada,
-            :percentual_maior_desconto, :maximo_adesao, :item_excluido,
-            CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-        )
-        ON CONFLICT (id)
-        DO UPDATE SET
-            descricao = EXCLUDED.descricao,
-            tipo_item = EXCLUDED.tipo_item,
-            valor_unitario = EXCLUDED.valor_unitario,
-            valor_total = EXCLUDED.valor_total,
-            quantidade = EXCLUDED.quantidade,
-            unidade = EXCLUDED.unidade,
-            marca = EXCLUDED.marca,
-            modelo = EXCLUDED.modelo,
-            classificacao_fornecedor = EXCLUDED.classificacao_fornecedor,
-            cnpj_fornecedor = EXCLUDED.cnpj_fornecedor,
-            nome_fornecedor = EXCLUDED.nome_fornecedor,
-            situacao_sicaf = EXCLUDED.situacao_sicaf,
-            quantidade_empenhada = EXCLUDED.quantidade_empenhada,
-            percentual_maior_desconto = EXCLUDED.percentual_maior_desconto,
-            item_excluido = EXCLUDED.item_excluido,
-            updated_at = CURRENT_TIMESTAMP,
-            last_synced_at = CURRENT_TIMESTAMP
-    """)
+    def item_key(item: Dict[str, Any]) -> Any:
+        if item.get("numero_item") is None:
+            return item.get("id")
+        return (item.get("arp_id"), item.get("numero_item"))
+
+    records = _upsert_records(items, ITEM_RECORD, key=item_key)
 
     try:
-        await session.execute(query, items)
-        logger.debug("bulk_upsert_items_success", count=len(items))
-        return len(items)
+        count = await _copy_upsert(
+            session, ITEM_STAGE_TABLE, ITEM_STAGE_RESET_SQL,
+            ITEM_UPSERT_COLUMNS, records, ITEM_UPSERT_FROM_STAGE_SQL
+        )
+        logger.debug("bulk_upsert_items_success", count=count)
+        return count
     except Exception as e:
         logger.error("bulk_upsert_items_error", error=str(e), count=len(items))
         raise
@@ -288,6 +448,20 @@ async def bulk_upsert_items(session: AsyncSession, items: List[Dict[str, Any]])
 # QUERY HELPERS
 # ============================================================================
 
+# Single-row lookups run on the session's asyncpg connection with fetchrow(),
+# like the bulk writes: one round trip, a Record converted straight to a dict.
+
+# Lookup columns only: objeto and search_vector are the widest values of a row
+ARP_BY_CODIGO_API_SQL = """
+    SELECT
+        id, codigo_arp_api, numero_arp, numero_compra, ano_compra, uasg_id,
+        data_inicio_vigencia, data_fim_vigencia, data_atualizacao_pncp,
+        quantidade_itens, ata_excluido, last_synced_at
+    FROM arps
+    WHERE codigo_arp_api = $1
+"""
+
+
 async def get_arp_by_codigo_api(session: AsyncSession, codigo_arp_api: str) -> Optional[Dict[str, Any]]:
     """
     Get ARP by API code
@@ -299,19 +473,28 @@ async def get_arp_by_codigo_api(session: AsyncSession, codigo_arp_api: str) -> O
     Returns:
         ARP dictionary or None
     """
-    query = text("""
-        SELECT * FROM arps
-        WHERE codigo_arp_api = :codigo_arp_api
-    """)
-
-    result = await session.execute(query, {"codigo_arp_api": codigo_arp_api})
-    row = result.fetchone()
+    driver_connection = await _driver_connection(session)
+    row = await driver_connection.fetchrow(ARP_BY_CODIGO_API_SQL, codigo_arp_api)
 
     if row:
-        return dict(row._mapping)
+        return dict(row)
     return None
 
 
+# Execution columns used for scheduling/resume (not config_snapshot or error_message)
+EXECUTION_COLUMNS = """
+    id, execution_type, status, started_at, completed_at,
+    date_range_start, date_range_end, last_ata_page_processed, total_ata_pages
+"""
+
+LAST_SUCCESSFUL_EXECUTION_SQL = f"""
+    SELECT {EXECUTION_COLUMNS} FROM etl_executions
+    WHERE status = 'completed'
+    ORDER BY completed_at DESC
+    LIMIT 1
+"""
+
+
 async def get_last_successful_execution(session: AsyncSession) -> Optional[Dict[str, Any]]:
     """
     Get last successful ETL execution
@@ -322,21 +505,23 @@ async def get_last_successful_execution(session: AsyncSession) -> Optional[Dict[
     Returns:
         Execution dictionary or None
     """
-    query = text("""
-        SELECT * FROM etl_executions
-        WHERE status = 'completed'
-        ORDER BY completed_at DESC
-        LIMIT 1
-    """)
-
-    result = await session.execute(query)
-    row = result.fetchone()
+    driver_connection = await _driver_connection(session)
+    row = await driver_connection.fetchrow(LAST_SUCCESSFUL_EXECUTION_SQL)
 
     if row:
-        return dict(row._mapping)
+        return dict(row)
     return None
 
 
+INCOMPLETE_EXECUTION_SQL = f"""
+    SELECT {EXECUTION_COLUMNS} FROM etl_executions
+    WHERE status IN ('running', 'failed')
+    AND last_ata_page_processed IS NOT NULL
+    ORDER BY started_at DESC
+    LIMIT 1
+"""
+
+
 async def get_incomplete_execution(session: AsyncSession) -> Optional[Dict[str, Any]]:
     """
     Get incomplete/failed ETL execution for resume
@@ -347,26 +532,56 @@ async def get_incomplete_execution(session: AsyncSession) -> Optional[Dict[str,
     Returns:
         Execution dictionary or None
     """
-    query = text("""
-        SELECT * FROM etl_executions
-        WHERE status IN ('running', 'failed')
-        AND last_ata_page_processed IS NOT NULL
-        ORDER BY started_at DESC
-        LIMIT 1
-    """)
-
-    result = await session.execute(query)
-    row = result.fetchone()
+    driver_connection = await _driver_connection(session)
+    row = await driver_connection.fetchrow(INCOMPLETE_EXECUTION_SQL)
 
     if row:
-        return dict(row._mapping)
+        return dict(row)
     return None
 
 
+REFRESH_ETL_SUMMARY_SQL = text("SELECT refresh_etl_summary()")
+
+
+async def refresh_etl_summary(session: AsyncSession) -> None:
+    """
+    Recompute the etl_summary counters read by /admin/etl/stats
+
+    Args:
+        session: Database session
+    """
+    await session.execute(REFRESH_ETL_SUMMARY_SQL)
+
+
+# Read by the API; refreshed after each execution (migrations 006, 008)
+MATERIALIZED_VIEWS = ("mv_search_items", "mv_supplier_rollup")
+
+REFRESH_VIEW_SQL = {
+    view: text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+    for view in MATERIALIZED_VIEWS
+}
+
+
+async def refresh_materialized_views(session: AsyncSession) -> None:
+    """
+    Refresh the materialized views read by the API
+
+    CONCURRENTLY keeps each view readable by the API during its refresh.
+
+    Args:
+        session: Database session
+    """
+    for view in MATERIALIZED_VIEWS:
+        await session.execute(REFRESH_VIEW_SQL[view])
+
+
 # ============================================================================
 # HEALTH CHECK
 # ============================================================================
 
+HEALTHCHECK_SQL = text("SELECT 1")
+
+
 async def check_database_connection() -> bool:
     """
     Check if database connection is healthy
@@ -376,7 +591,7 @@ async def check_database_connection() -> bool:
     """
     try:
         async with get_db_session() as session:
-            await session.execute(text("SELECT 1"))
+            await session.execute(HEALTHCHECK_SQL)
         logger.info("database_health_check_success")
         return True
     except Exception as e:
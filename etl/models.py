@@ -7,7 +7,7 @@ Used for type-safe database operations in the ETL process.
 
 from sqlalchemy import (
     Column, String, Integer, Numeric, Date, DateTime, Boolean, Text,
-    ForeignKey, Index, func
+    ForeignKey, Index, Computed, func
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import declarative_base, relationship
@@ -102,8 +102,13 @@ class Arp(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     last_synced_at = Column(DateTime, index=True)
 
-    # Full-text search (generated column - managed by database)
-    # search_vector = Column(TSVECTOR)  # Commented out as it's auto-generated
+    # Full-text search (generated column, same expression as 001_enhanced_schema.sql)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('portuguese', coalesce(numero_arp, '')), 'A') || "
+        "setweight(to_tsvector('portuguese', coalesce(objeto, '')), 'B') || "
+        "setweight(to_tsvector('portuguese', coalesce(nome_orgao, '')), 'C')",
+        persisted=True
+    ))
 
     # Relationships
     orgao = relationship("Orgao", back_populates="arps")
@@ -113,6 +118,12 @@ class Arp(Base):
     __table_args__ = (
         Index('idx_arps_vigencia_range', 'data_inicio_vigencia', 'data_fim_vigencia'),
         Index('idx_arps_uasg_vigencia', 'uasg_id', 'data_fim_vigencia'),
+        Index('idx_arps_valid', 'data_fim_vigencia', 'uasg_id',
+              postgresql_where=expression.text('ata_excluido = FALSE')),
+        Index('idx_arps_data_atualizacao_pncp', 'data_atualizacao_pncp'),
+        Index('idx_arps_active_totals', 'data_fim_vigencia',
+              postgresql_include=['valor_total'],
+              postgresql_where=expression.text('ata_excluido = FALSE')),
     )
 
     def __repr__(self):
@@ -182,8 +193,14 @@ class ItemArp(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     last_synced_at = Column(DateTime)
 
-    # Full-text search (generated column - managed by database)
-    # search_vector = Column(TSVECTOR)  # Commented out as it's auto-generated
+    # Full-text search (generated column, same expression as 001_enhanced_schema.sql)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('portuguese', coalesce(descricao, '')), 'A') || "
+        "setweight(to_tsvector('portuguese', coalesce(marca, '')), 'B') || "
+        "setweight(to_tsvector('portuguese', coalesce(modelo, '')), 'B') || "
+        "setweight(to_tsvector('portuguese', coalesce(nome_fornecedor, '')), 'C')",
+        persisted=True
+    ))
 
     # Relationships
     arp = relationship("Arp", back_populates="itens")
@@ -192,6 +209,11 @@ class ItemArp(Base):
     __table_args__ = (
         Index('idx_itens_arp_valor', 'arp_id', 'valor_unitario'),
         Index('idx_itens_arp_fornecedor', 'arp_id', 'cnpj_fornecedor'),
+        Index('idx_itens_arp_numero_item', 'arp_id', 'numero_item', unique=True),
+        Index('idx_itens_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('idx_itens_supplier_active', 'cnpj_fornecedor', 'nome_fornecedor',
+              postgresql_include=['arp_id', 'valor_total', 'valor_unitario'],
+              postgresql_where=expression.text('item_excluido = FALSE')),
     )
 
     def __repr__(self):
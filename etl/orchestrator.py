@@ -15,8 +15,12 @@ import structlog
 import json
 
 from config import config
-from database import get_db_session, get_last_successful_execution, get_incomplete_execution
+from database import (
+    get_db_session, get_last_successful_execution, get_incomplete_execution,
+    refresh_etl_summary, refresh_materialized_views
+)
 from api_client import AsyncARPAPIClient
+from utils.cache_utils import invalidate_api_cache
 from processors.arp_processor import ARPProcessor
 from processors.item_processor import ItemProcessor
 from utils.date_utils import generate_quarterly_chunks, get_incremental_date_window
@@ -24,6 +28,13 @@ from models import EtlExecution
 
 logger = structlog.get_logger(__name__)
 
+# etl_executions counter columns, as keyed in the stats dicts
+EXECUTION_COUNTERS = (
+    "arps_fetched", "arps_inserted", "arps_updated", "arps_skipped",
+    "items_fetched", "items_inserted", "items_updated", "items_skipped",
+    "errors_count",
+)
+
 
 class ETLOrchestrator:
     """
@@ -167,9 +178,15 @@ class ETLOrchestrator:
         self,
         session: AsyncSession,
         status: str,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        stats: Optional[Dict[str, int]] = None
     ):
-        """Mark execution as completed or failed"""
+        """
+        Mark execution as completed or failed
+
+        Final counters (stats) are written in the same UPDATE; without them
+        the last checkpointed counters are kept.
+        """
         if not self.execution_id:
             return
 
@@ -179,18 +196,46 @@ class ETLOrchestrator:
                 status = :status,
                 completed_at = CURRENT_TIMESTAMP,
                 duration_seconds = EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - started_at)),
-                error_message = :error_message
+                error_message = :error_message,
+                arps_fetched = COALESCE(:arps_fetched, arps_fetched),
+                arps_inserted = COALESCE(:arps_inserted, arps_inserted),
+                arps_updated = COALESCE(:arps_updated, arps_updated),
+                arps_skipped = COALESCE(:arps_skipped, arps_skipped),
+                items_fetched = COALESCE(:items_fetched, items_fetched),
+                items_inserted = COALESCE(:items_inserted, items_inserted),
+                items_updated = COALESCE(:items_updated, items_updated),
+                items_skipped = COALESCE(:items_skipped, items_skipped),
+                errors_count = COALESCE(:errors_count, errors_count)
             WHERE id = :execution_id
         """)
 
         await session.execute(query, {
             "execution_id": self.execution_id,
             "status": status,
-            "error_message": error_message
+            "error_message": error_message,
+            **{counter: (stats or {}).get(counter) for counter in EXECUTION_COUNTERS}
         })
 
         await session.commit()
 
+        # Refresh counters served by /admin/etl/stats
+        try:
+            await refresh_etl_summary(session)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.warning("etl_summary_refresh_failed", error=str(e))
+
+        # Refresh the views read by search and supplier endpoints
+        try:
+            await refresh_materialized_views(session)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.warning("materialized_views_refresh_failed", error=str(e))
+
+        await invalidate_api_cache()
+
         logger.info(
             "execution_completed",
             execution_id=self.execution_id,
@@ -367,15 +412,8 @@ class ETLOrchestrator:
                     "errors_count": stats.get("errors", 0)
                 }
 
-                await self._update_execution_progress(
-                    session,
-                    page=1,
-                    total_pages=1,
-                    stats=total_stats
-                )
-
-                # Mark as completed
-                await self._complete_execution(session, "completed")
+                # Mark as completed (counters written in the same UPDATE)
+                await self._complete_execution(session, "completed", stats=total_stats)
 
                 logger.info(
                     "incremental_update_completed",
@@ -5,7 +5,7 @@ Handles fetching, transforming, and persisting ARP items data.
 """
 
 import asyncio
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, AsyncIterator
 from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
@@ -101,47 +101,79 @@ class ItemProcessor:
         self,
         arps: List[Dict[str, Any]],
         max_concurrent: int = None
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
         """
         Fetch items for multiple ARPs concurrently
 
+        Yields each ARP's items as soon as its fetch completes (not in input
+        order), so the caller can persist them while the remaining fetches are
+        still in flight.
+
+        The items endpoint is queried by (numero_compra, uasg, vigência), so
+        ARPs sharing that key are fetched once and all receive the result.
+
         Args:
             arps: List of ARP dictionaries
             max_concurrent: Maximum concurrent requests (defaults to config)
 
-        Returns:
-            Dictionary mapping arp_id to list of items
+        Yields:
+            (arp_id, items) tuples
         """
         if max_concurrent is None:
             max_concurrent = config.MAX_CONCURRENT_ITEM_REQUESTS
 
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def fetch_with_limit(arp: Dict[str, Any]):
-            async with semaphore:
-                items = await self.fetch_items_for_arp(arp)
-                return arp.get("id"), items
+        # Overlapping listing pages can repeat an ARP (same codigo_arp_api):
+        # keep the last copy, as the upsert does
+        unique_arps = list({
+            arp.get("codigo_arp_api") or arp.get("id"): arp for arp in arps
+        }.values())
 
-        tasks = [fetch_with_limit(arp) for arp in arps]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        arps_by_fetch_key: Dict[Tuple[Any, Any, Any], List[Dict[str, Any]]] = {}
+        for arp in unique_arps:
+            fetch_key = (arp.get("numero_compra"), arp.get("uasg_id"), arp.get("data_inicio_vigencia"))
+            arps_by_fetch_key.setdefault(fetch_key, []).append(arp)
 
-        items_by_arp = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error("concurrent_fetch_exception", error=str(result))
-                continue
+        async def fetch_with_limit(group: List[Dict[str, Any]]):
+            async with semaphore:
+                items = await self.fetch_items_for_arp(group[0])
+                return group, items
+
+        # Largest ARPs first (by quantidade_itens, unknown counted as 0): the
+        # semaphore admits tasks in creation order, so a many-page ARP no longer
+        # starts last and stretches the tail while the other slots sit idle
+        by_size = sorted(
+            arps_by_fetch_key.values(),
+            key=lambda group: group[0].get("quantidade_itens") or 0,
+            reverse=True
+        )
+        tasks = [asyncio.create_task(fetch_with_limit(group)) for group in by_size]
+        arps_with_items = 0
 
-            arp_id, items = result
-            items_by_arp[arp_id] = items
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    group, items = await next_done
+                except Exception as e:
+                    logger.error("concurrent_fetch_exception", error=str(e))
+                    continue
+
+                for arp in group:
+                    arps_with_items += 1
+                    yield arp.get("id"), items
+        finally:
+            # Consumer stopped early or failed: don't leave fetches running
+            for task in tasks:
+                task.cancel()
 
         logger.info(
             "concurrent_items_fetch_complete",
             arps_count=len(arps),
-            arps_with_items=len(items_by_arp)
+            fetches=len(tasks),
+            arps_with_items=arps_with_items
         )
 
-        return items_by_arp
-
     async def process_and_persist_items(
         self,
         session: AsyncSession,
@@ -253,11 +285,9 @@ class ItemProcessor:
         }
 
         if concurrent:
-            # Fetch all items concurrently
-            items_by_arp = await self.fetch_items_for_arps_concurrent(arps)
-
-            # Process each ARP's items
-            for arp_id, api_items in items_by_arp.items():
+            # Persist each ARP's items as soon as they arrive, while the
+            # other fetches continue
+            async for arp_id, api_items in self.fetch_items_for_arps_concurrent(arps):
                 if api_items:
                     await self.process_and_persist_items(
                         session,
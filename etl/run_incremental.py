@@ -16,13 +16,10 @@ import structlog
 from orchestrator import run_etl_incremental
 from config import config
 from database import cleanup
+from utils.log_utils import configure_logging
 
 # Configure logging
-structlog.configure(
-    wrapper_class=structlog.make_filtering_bound_logger(
-        getattr(structlog.processors, config.LOG_LEVEL)
-    )
-)
+configure_logging()
 
 logger = structlog.get_logger(__name__)
 
@@ -15,18 +15,14 @@ import argparse
 from datetime import date
 import sys
 import structlog
-import logging
 
 from orchestrator import run_etl_initial_load
 from config import config
 from database import cleanup
+from utils.log_utils import configure_logging
 
 # Configure logging
-structlog.configure(
-    wrapper_class=structlog.make_filtering_bound_logger(
-        getattr(logging, config.LOG_LEVEL)
-    )
-)
+configure_logging()
 
 logger = structlog.get_logger(__name__)
 
@@ -19,13 +19,10 @@ import structlog
 from config import config
 from orchestrator import run_etl_incremental
 from database import cleanup
+from utils.log_utils import configure_logging
 
 # Configure logging
-structlog.configure(
-    wrapper_class=structlog.make_filtering_bound_logger(
-        getattr(structlog.processors, config.LOG_LEVEL)
-    )
-)
+configure_logging()
 
 logger = structlog.get_logger(__name__)
 
@@ -0,0 +1,40 @@
+"""
+Cache Utilities
+
+Invalidation of the API's shared Redis cache after ETL runs.
+"""
+
+import structlog
+import redis.asyncio as redis
+
+from config import config
+
+logger = structlog.get_logger(__name__)
+
+# Keys rendered by the API that must not outlive an ETL run (see backend/cache.py)
+API_CACHE_KEYS = ("stats:v1",)
+
+# Data version embedded in versioned API keys and ETags (e.g. /arp/{id});
+# bumping it orphans those entries, which then expire by TTL
+ETL_VERSION_KEY = "etl:current_version"
+
+
+async def invalidate_api_cache() -> None:
+    """
+    Delete API cache entries derived from ETL-loaded data and bump the data version
+
+    No-op when REDIS_URL is not configured. Failures are logged, never raised:
+    the API entries still expire by TTL.
+    """
+    if not config.REDIS_URL:
+        return
+
+    client = redis.from_url(config.REDIS_URL)
+    try:
+        await client.delete(*API_CACHE_KEYS)
+        version = await client.incr(ETL_VERSION_KEY)
+        logger.info("api_cache_invalidated", keys=API_CACHE_KEYS, version=version)
+    except redis.RedisError as e:
+        logger.warning("api_cache_invalidation_failed", error=str(e))
+    finally:
+        await client.aclose()
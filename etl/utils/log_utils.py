@@ -0,0 +1,42 @@
+"""
+Logging Utilities
+
+structlog configuration shared by the ETL entry points (run_*.py, scheduler.py).
+"""
+
+import logging
+import orjson
+import structlog
+
+from config import config
+
+
+def configure_logging() -> None:
+    """
+    Configure structlog from LOG_LEVEL and LOG_FORMAT
+
+    'json' renders with orjson straight to bytes (BytesLoggerFactory, no
+    str round trip); 'console' keeps structlog's human-readable renderer.
+    Loggers are cached on first use, so calls below LOG_LEVEL are no-ops.
+    """
+    processors = [
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+
+    if config.LOG_FORMAT == "json":
+        processors.append(structlog.processors.format_exc_info)
+        processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+        logger_factory = structlog.BytesLoggerFactory()
+    else:
+        processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, config.LOG_LEVEL)
+        ),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
@@ -0,0 +1,63 @@
+-- AtaHub Carona - GIN index on itens_arp.search_vector
+-- Migration: 002_itens_search_vector_gin.sql
+-- Purpose: Guarantee the full-text index matches the search predicate
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /buscar, /comparar and /exportar filter with
+--     itens.search_vector @@ plainto_tsquery('portuguese', :q)
+-- Postgres only uses a GIN index for this predicate when the index is built
+-- on the search_vector column itself. An index on an expression such as
+-- to_tsvector('portuguese', descricao) does not match and the query falls
+-- back to a sequential scan of itens_arp.
+--
+-- search_vector is a GENERATED ALWAYS column (see 001), so it is kept in sync
+-- by Postgres on every INSERT/UPDATE; no trigger is needed.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- DROP MISMATCHED / INVALID INDEX
+-- ============================================================================
+-- Drop idx_itens_search_vector if it was created on an expression instead of
+-- the column, or if a previous CONCURRENTLY build failed and left it INVALID.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM pg_indexes
+        WHERE tablename = 'itens_arp'
+          AND indexname = 'idx_itens_search_vector'
+          AND indexdef NOT LIKE '%USING gin (search_vector)'
+    ) OR EXISTS (
+        SELECT 1
+        FROM pg_index
+        WHERE indexrelid = to_regclass('idx_itens_search_vector')
+          AND NOT indisvalid
+    ) THEN
+        DROP INDEX idx_itens_search_vector;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- INDEX: itens_arp.search_vector
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_itens_search_vector
+    ON itens_arp USING gin(search_vector);
+
+ANALYZE itens_arp;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- 1. Index definition must be on the column, not an expression
+-- SELECT indexname, indexdef FROM pg_indexes
+-- WHERE tablename = 'itens_arp' AND indexdef ILIKE '%gin%';
+--
+-- 2. Plan must show "Bitmap Index Scan on idx_itens_search_vector"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT id FROM itens_arp
+-- WHERE search_vector @@ plainto_tsquery('portuguese', 'caneta');
@@ -0,0 +1,41 @@
+-- AtaHub Carona - Partial index for valid (non-expired, non-excluded) ARPs
+-- Migration: 003_arps_valid_index.sql
+-- Purpose: Index the vigência filter used by search and dashboard counts
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- Search endpoints filter with
+--     arps.data_fim_vigencia >= CURRENT_DATE AND arps.ata_excluido = FALSE
+-- and join orgaos ON arps.uasg_id = orgaos.uasg. /admin/etl/stats counts
+--     COUNT(*) FILTER (WHERE data_fim_vigencia >= CURRENT_DATE AND ata_excluido = FALSE)
+--
+-- idx_arps_uasg_vigencia (001) leads with uasg_id, so it cannot serve a range
+-- scan on data_fim_vigencia alone. idx_arps_valid leads with the date so valid
+-- ARPs are read as one index range (index-only when the visibility map is
+-- current), carrying uasg_id for the join to orgaos.
+--
+-- idx_arps_uasg (arps.uasg_id) already exists since 001.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- INDEX: arps valid range
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_arps_valid
+    ON arps(data_fim_vigencia, uasg_id)
+    WHERE ata_excluido = FALSE;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_arps_uasg ON arps(uasg_id);
+
+VACUUM ANALYZE arps;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Index Only Scan using idx_arps_valid"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT COUNT(*) FROM arps
+-- WHERE data_fim_vigencia >= CURRENT_DATE AND ata_excluido = FALSE;
@@ -0,0 +1,41 @@
+-- AtaHub Carona - Trigram index on itens_arp.descricao
+-- Migration: 004_itens_descricao_trgm.sql
+-- Purpose: Support partial-word / typo matches as a fallback to full-text search
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- plainto_tsquery does not match substrings or misspellings ("caneta esfero"
+-- misses "esferográfica"). When the full-text search in /buscar returns no
+-- rows, the API retries with
+--     :q <% descricao ORDER BY word_similarity(:q, descricao) DESC
+-- (word similarity: a short query against a long description stays above
+-- the threshold), which is served by a gin_trgm_ops index instead of a
+-- sequential scan.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- EXTENSIONS
+-- ============================================================================
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+-- ============================================================================
+-- INDEX: itens_arp.descricao (trigram)
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_itens_descricao_trgm
+    ON itens_arp USING gin(descricao gin_trgm_ops);
+
+ANALYZE itens_arp;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Bitmap Index Scan on idx_itens_descricao_trgm"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT id FROM itens_arp
+-- WHERE 'caneta esfero' <% descricao
+-- ORDER BY word_similarity('caneta esfero', descricao) DESC
+-- LIMIT 50;
@@ -0,0 +1,101 @@
+-- AtaHub Carona - ETL summary table
+-- Migration: 005_etl_summary.sql
+-- Purpose: Precomputed counts for /admin/etl/stats (O(1) read instead of full-table COUNTs)
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /admin/etl/stats used to aggregate arps, itens_arp and etl_executions on every
+-- request, which grows linearly with the data. The ETL now refreshes this
+-- single-row table at the end of each execution (refresh_etl_summary()), and
+-- the API just reads it.
+--
+-- valid_arps depends on CURRENT_DATE, so it reflects the date of the last
+-- refresh (the scheduled ETL runs daily).
+
+-- ============================================================================
+-- TABLE: etl_summary (single row)
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS etl_summary (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+
+    -- ARPs
+    total_arps BIGINT NOT NULL DEFAULT 0,
+    active_arps BIGINT NOT NULL DEFAULT 0,
+    valid_arps BIGINT NOT NULL DEFAULT 0,
+    oldest_arp DATE,
+    newest_arp DATE,
+
+    -- Items
+    total_items BIGINT NOT NULL DEFAULT 0,
+    active_items BIGINT NOT NULL DEFAULT 0,
+
+    -- Executions
+    total_executions BIGINT NOT NULL DEFAULT 0,
+    completed BIGINT NOT NULL DEFAULT 0,
+    failed BIGINT NOT NULL DEFAULT 0,
+
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE etl_summary IS 'Single-row ETL/data counters, refreshed by the ETL after each execution';
+
+-- ============================================================================
+-- FUNCTION: refresh_etl_summary()
+-- ============================================================================
+-- Recomputes all counters and upserts the single row. Returns the new row.
+CREATE OR REPLACE FUNCTION refresh_etl_summary()
+RETURNS etl_summary AS $$
+    INSERT INTO etl_summary AS s (
+        id, total_arps, active_arps, valid_arps, oldest_arp, newest_arp,
+        total_items, active_items, total_executions, completed, failed, refreshed_at
+    )
+    SELECT
+        1,
+        a.total_arps, a.active_arps, a.valid_arps, a.oldest_arp, a.newest_arp,
+        i.total_items, i.active_items,
+        e.total_executions, e.completed, e.failed,
+        CURRENT_TIMESTAMP
+    FROM (
+        SELECT
+            COUNT(*) as total_arps,
+            COUNT(*) FILTER (WHERE ata_excluido = FALSE) as active_arps,
+            COUNT(*) FILTER (WHERE data_fim_vigencia >= CURRENT_DATE AND ata_excluido = FALSE) as valid_arps,
+            MIN(data_inicio_vigencia) as oldest_arp,
+            MAX(data_fim_vigencia) as newest_arp
+        FROM arps
+    ) a, (
+        SELECT
+            COUNT(*) as total_items,
+            COUNT(*) FILTER (WHERE item_excluido = FALSE) as active_items
+        FROM itens_arp
+    ) i, (
+        SELECT
+            COUNT(*) as total_executions,
+            COUNT(*) FILTER (WHERE status = 'completed') as completed,
+            COUNT(*) FILTER (WHERE status = 'failed') as failed
+        FROM etl_executions
+    ) e
+    ON CONFLICT (id) DO UPDATE SET
+        total_arps = EXCLUDED.total_arps,
+        active_arps = EXCLUDED.active_arps,
+        valid_arps = EXCLUDED.valid_arps,
+        oldest_arp = EXCLUDED.oldest_arp,
+        newest_arp = EXCLUDED.newest_arp,
+        total_items = EXCLUDED.total_items,
+        active_items = EXCLUDED.active_items,
+        total_executions = EXCLUDED.total_executions,
+        completed = EXCLUDED.completed,
+        failed = EXCLUDED.failed,
+        refreshed_at = EXCLUDED.refreshed_at
+    RETURNING s.*;
+$$ LANGUAGE sql;
+
+-- Seed with current data
+SELECT refresh_etl_summary();
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- SELECT * FROM etl_summary;
@@ -0,0 +1,83 @@
+-- AtaHub Carona - Materialized view for item search
+-- Migration: 006_mv_search_items.sql
+-- Purpose: Pre-join itens_arp + arps + orgaos for /buscar, /comparar and /exportar
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- Every search joined three tables and filtered out excluded ARPs/items.
+-- mv_search_items holds that join for non-excluded items of ARPs that were
+-- valid at refresh time, so search becomes a single-table scan driven by the
+-- GIN index on search_vector.
+--
+-- item_json is the prebuilt SearchResult "item" object (see 011).
+--
+-- The ETL runs REFRESH MATERIALIZED VIEW CONCURRENTLY at the end of each
+-- execution (requires the unique index on id). The API still filters
+-- data_fim_vigencia >= CURRENT_DATE so ARPs expiring between refreshes drop out.
+--
+-- The view is built WITH DATA, so the first run takes about as long as one full
+-- search join over the tables.
+
+-- ============================================================================
+-- MATERIALIZED VIEW: mv_search_items
+-- ============================================================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_search_items AS
+SELECT
+    itens.id,
+    itens.descricao,
+    itens.valor_unitario,
+    itens.quantidade,
+    itens.marca,
+    itens.modelo,
+    itens.unidade,
+    itens.nome_fornecedor,
+    itens.search_vector,
+    json_build_object(
+        'descricao', itens.descricao,
+        'valor_unitario', itens.valor_unitario::float8,
+        'marca', itens.marca,
+        'quantidade', itens.quantidade::float8,
+        'modelo', itens.modelo,
+        'unidade', itens.unidade,
+        'fornecedor', itens.nome_fornecedor
+    ) AS item_json,
+    arps.id AS arp_id,
+    arps.numero_arp,
+    arps.data_inicio_vigencia,
+    arps.data_fim_vigencia,
+    orgaos.nome AS orgao_nome,
+    orgaos.uf
+FROM itens_arp itens
+JOIN arps ON itens.arp_id = arps.id
+JOIN orgaos ON arps.uasg_id = orgaos.uasg
+WHERE arps.data_fim_vigencia >= CURRENT_DATE
+  AND arps.ata_excluido = FALSE
+  AND itens.item_excluido = FALSE
+WITH DATA;
+
+COMMENT ON MATERIALIZED VIEW mv_search_items IS 'Searchable items of valid ARPs; refreshed by the ETL after each execution';
+
+-- ============================================================================
+-- INDEXES: mv_search_items
+-- ============================================================================
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_search_items_id ON mv_search_items(id);
+
+-- Full-text search and trigram fallback
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_search_vector ON mv_search_items USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_descricao_trgm ON mv_search_items USING gin(descricao gin_trgm_ops);
+
+-- Filters and sorts (uf and vigência: composite indexes in 007 and 010)
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_valor ON mv_search_items(valor_unitario);
+
+ANALYZE mv_search_items;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Bitmap Index Scan on idx_mv_search_items_search_vector"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT id FROM mv_search_items
+-- WHERE search_vector @@ plainto_tsquery('portuguese', 'caneta');
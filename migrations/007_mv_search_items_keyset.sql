@@ -0,0 +1,38 @@
+-- AtaHub Carona - Keyset index for date-sorted search
+-- Migration: 007_mv_search_items_keyset.sql
+-- Purpose: Support (data_fim_vigencia, id) seek pagination on /buscar
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /buscar sorted by date (the default without q) orders by
+--     data_fim_vigencia DESC, id DESC   (or ASC, ASC)
+-- and pages with ?after=<data_fim_vigencia>|<id>, i.e.
+--     (data_fim_vigencia, id) < (:after_key, :after_id)
+-- A composite btree on (data_fim_vigencia, id) serves both directions (scanned
+-- backward for DESC), so page N costs the same as page 1 instead of scanning
+-- and discarding OFFSET rows. It supersedes the single-column
+-- idx_mv_search_items_vigencia_fim from 006.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- INDEX: mv_search_items (data_fim_vigencia, id)
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mv_search_items_vigencia_id
+    ON mv_search_items(data_fim_vigencia, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_mv_search_items_vigencia_fim;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Index Scan Backward using idx_mv_search_items_vigencia_id"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT id FROM mv_search_items
+-- WHERE data_fim_vigencia >= CURRENT_DATE
+--   AND (data_fim_vigencia, id) < ('2027-01-01'::date, '00000000-0000-0000-0000-000000000000'::uuid)
+-- ORDER BY data_fim_vigencia DESC, id DESC
+-- LIMIT 50;
@@ -0,0 +1,54 @@
+-- AtaHub Carona - Supplier rollup
+-- Migration: 008_mv_supplier_rollup.sql
+-- Purpose: Precomputed per-supplier aggregates for /fornecedores and /stats
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /fornecedores and the top suppliers block of /stats grouped itens_arp by
+-- supplier on every request, with COUNT(DISTINCT arp_id) forcing a sort of all
+-- active items. mv_supplier_rollup stores one row per (cnpj, nome) with the
+-- exact distinct ARP count, total value and average unit price; the endpoints
+-- read it with an index scan (top-K) or a trigram match (search).
+--
+-- NULL cnpj/nome are stored as '' so the unique index covers every row, as
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY requires. The ETL refreshes the view
+-- at the end of each execution, together with mv_search_items (006).
+
+-- ============================================================================
+-- MATERIALIZED VIEW: mv_supplier_rollup
+-- ============================================================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_supplier_rollup AS
+SELECT
+    COALESCE(cnpj_fornecedor, '') AS cnpj_fornecedor,
+    COALESCE(nome_fornecedor, '') AS nome_fornecedor,
+    COUNT(DISTINCT arp_id) AS total_contracts,
+    COALESCE(SUM(valor_total), 0) AS total_value,
+    COALESCE(AVG(valor_unitario), 0) AS avg_price
+FROM itens_arp
+WHERE item_excluido = FALSE
+GROUP BY 1, 2
+WITH DATA;
+
+COMMENT ON MATERIALIZED VIEW mv_supplier_rollup IS 'Per-supplier aggregates of active items; refreshed by the ETL after each execution';
+
+-- ============================================================================
+-- INDEXES: mv_supplier_rollup
+-- ============================================================================
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_supplier_rollup_key ON mv_supplier_rollup(cnpj_fornecedor, nome_fornecedor);
+
+-- Top-K by contracts
+CREATE INDEX IF NOT EXISTS idx_mv_supplier_rollup_contracts ON mv_supplier_rollup(total_contracts DESC);
+
+-- ILIKE '%q%' / LIKE '%q%' search
+CREATE INDEX IF NOT EXISTS idx_mv_supplier_rollup_nome_trgm ON mv_supplier_rollup USING gin(nome_fornecedor gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_mv_supplier_rollup_cnpj_trgm ON mv_supplier_rollup USING gin(cnpj_fornecedor gin_trgm_ops);
+
+ANALYZE mv_supplier_rollup;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- SELECT * FROM mv_supplier_rollup ORDER BY total_contracts DESC LIMIT 10;
@@ -0,0 +1,52 @@
+-- AtaHub Carona - Covering indexes for value aggregates
+-- Migration: 009_covering_aggregate_indexes.sql
+-- Purpose: Index-only scans for /stats totals and the supplier rollup refresh
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /stats sums arps.valor_total over non-excluded ARPs and counts the valid ones:
+--     SUM(valor_total), COUNT(*) FILTER (WHERE data_fim_vigencia >= CURRENT_DATE)
+--     FROM arps WHERE ata_excluido = FALSE
+-- and the mv_supplier_rollup refresh (008) aggregates every active item:
+--     COUNT(DISTINCT arp_id), SUM(valor_total), AVG(valor_unitario)
+--     FROM itens_arp WHERE item_excluido = FALSE GROUP BY cnpj, nome
+--
+-- Both read every heap page today. With the aggregated columns INCLUDEd in
+-- partial indexes, Postgres can answer them with index-only scans (no heap
+-- I/O once the visibility map is current, hence the VACUUM ANALYZE), and the
+-- rollup index is already ordered by its GROUP BY key.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- INDEX: arps active totals
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_arps_active_totals
+    ON arps(data_fim_vigencia) INCLUDE (valor_total)
+    WHERE ata_excluido = FALSE;
+
+-- ============================================================================
+-- INDEX: itens_arp per supplier
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_itens_supplier_active
+    ON itens_arp(cnpj_fornecedor, nome_fornecedor) INCLUDE (arp_id, valor_total, valor_unitario)
+    WHERE item_excluido = FALSE;
+
+VACUUM ANALYZE arps;
+VACUUM ANALYZE itens_arp;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Index Only Scan using idx_arps_active_totals"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT COUNT(*), SUM(valor_total) FROM arps WHERE ata_excluido = FALSE;
+--
+-- Plan should show "Index Only Scan using idx_itens_supplier_active"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT cnpj_fornecedor, nome_fornecedor, COUNT(DISTINCT arp_id), SUM(valor_total)
+-- FROM itens_arp WHERE item_excluido = FALSE
+-- GROUP BY cnpj_fornecedor, nome_fornecedor;
@@ -0,0 +1,36 @@
+-- AtaHub Carona - State + vigência index on the search view
+-- Migration: 010_mv_search_items_uf_index.sql
+-- Purpose: Serve UF-filtered, date-sorted /buscar from one index range per state
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- uf, data_fim_vigencia and the exclusion flags are already denormalized into
+-- mv_search_items (006), so /buscar no longer joins arps/orgaos. The common
+-- "filter by state, newest first" request is
+--     WHERE uf = ANY(:ufs) AND data_fim_vigencia >= CURRENT_DATE
+--     ORDER BY data_fim_vigencia DESC, id DESC
+-- idx_mv_search_items_uf only narrows by state; (uf, data_fim_vigencia, id)
+-- also returns each state's rows in keyset order (007), and replaces it.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- INDEX: mv_search_items (uf, data_fim_vigencia, id)
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mv_search_items_uf_fim
+    ON mv_search_items(uf, data_fim_vigencia, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_mv_search_items_uf;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Index Scan ... using idx_mv_search_items_uf_fim"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT id FROM mv_search_items
+-- WHERE uf = 'SP' AND data_fim_vigencia >= CURRENT_DATE
+-- ORDER BY data_fim_vigencia DESC, id DESC
+-- LIMIT 50;
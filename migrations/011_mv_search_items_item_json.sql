@@ -0,0 +1,87 @@
+-- AtaHub Carona - Prebuilt item JSON in the search view
+-- Migration: 011_mv_search_items_item_json.sql
+-- Purpose: Build the SearchResult "item" object once per refresh instead of per request
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /buscar and /comparar render every result's nested "item" object with
+-- json_build_object(descricao, valor_unitario, marca, ...) on each request.
+-- mv_search_items now stores that object as item_json (json keeps the text as
+-- built, so embedding it in the response is a copy), and the endpoints only
+-- assemble the outer ARP fields around it.
+--
+-- Materialized views can't be ALTERed to add columns: databases that built
+-- the view before item_json existed get it dropped and recreated with all
+-- indexes from 006, 007 and 010. 006 now creates item_json directly, so on new
+-- databases and on re-runs this file is a no-op.
+
+-- ============================================================================
+-- RECREATE: mv_search_items (only if item_json is missing)
+-- ============================================================================
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = 'mv_search_items')
+       AND NOT EXISTS (
+           SELECT 1 FROM pg_attribute
+           WHERE attrelid = 'mv_search_items'::regclass
+             AND attname = 'item_json'
+             AND NOT attisdropped
+       ) THEN
+        DROP MATERIALIZED VIEW mv_search_items;
+    END IF;
+END $$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_search_items AS
+SELECT
+    itens.id,
+    itens.descricao,
+    itens.valor_unitario,
+    itens.quantidade,
+    itens.marca,
+    itens.modelo,
+    itens.unidade,
+    itens.nome_fornecedor,
+    itens.search_vector,
+    json_build_object(
+        'descricao', itens.descricao,
+        'valor_unitario', itens.valor_unitario::float8,
+        'marca', itens.marca,
+        'quantidade', itens.quantidade::float8,
+        'modelo', itens.modelo,
+        'unidade', itens.unidade,
+        'fornecedor', itens.nome_fornecedor
+    ) AS item_json,
+    arps.id AS arp_id,
+    arps.numero_arp,
+    arps.data_inicio_vigencia,
+    arps.data_fim_vigencia,
+    orgaos.nome AS orgao_nome,
+    orgaos.uf
+FROM itens_arp itens
+JOIN arps ON itens.arp_id = arps.id
+JOIN orgaos ON arps.uasg_id = orgaos.uasg
+WHERE arps.data_fim_vigencia >= CURRENT_DATE
+  AND arps.ata_excluido = FALSE
+  AND itens.item_excluido = FALSE
+WITH DATA;
+
+COMMENT ON MATERIALIZED VIEW mv_search_items IS 'Searchable items of valid ARPs; refreshed by the ETL after each execution';
+
+-- ============================================================================
+-- INDEXES: mv_search_items (same set as after 010)
+-- ============================================================================
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_search_items_id ON mv_search_items(id);
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_search_vector ON mv_search_items USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_descricao_trgm ON mv_search_items USING gin(descricao gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_valor ON mv_search_items(valor_unitario);
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_vigencia_id ON mv_search_items(data_fim_vigencia, id);
+CREATE INDEX IF NOT EXISTS idx_mv_search_items_uf_fim ON mv_search_items(uf, data_fim_vigencia, id);
+
+ANALYZE mv_search_items;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- SELECT item_json FROM mv_search_items LIMIT 5;
@@ -0,0 +1,32 @@
+-- AtaHub Carona - Index for PNCP update-window queries
+-- Migration: 012_arps_data_atualizacao_index.sql
+-- Purpose: Range scans on arps.data_atualizacao_pncp (incremental window checks)
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- Incremental window checks count ARPs updated on PNCP within a period
+-- (etl/check_db.py):
+--     SELECT COUNT(*) FROM arps
+--     WHERE data_atualizacao_pncp >= :start AND data_atualizacao_pncp < :end
+-- data_atualizacao_pncp had no index, so this was a sequential scan growing
+-- with the table. The query does not filter ata_excluido, so the index is not
+-- partial (a WHERE ata_excluido = FALSE index could not serve it).
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- INDEX: arps.data_atualizacao_pncp
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_arps_data_atualizacao_pncp
+    ON arps(data_atualizacao_pncp);
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Index Only Scan using idx_arps_data_atualizacao_pncp"
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT COUNT(*) FROM arps
+-- WHERE data_atualizacao_pncp >= '2025-11-01' AND data_atualizacao_pncp < '2025-12-01';
@@ -0,0 +1,90 @@
+-- AtaHub Carona - Natural key for ARP items
+-- Migration: 013_itens_arp_natural_key.sql
+-- Purpose: Unique (arp_id, numero_item) so the ETL can upsert items on it
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- The ETL generates a new UUID for every transformed item, so its upsert on
+-- ON CONFLICT (id) never matched and re-syncing an ARP inserted its items
+-- again. bulk_upsert_items (etl/database.py) now upserts on
+--     ON CONFLICT (arp_id, numero_item)
+-- which requires a unique index on exactly those columns. The key only
+-- matches if arp_id is the stored arps.id: transformed ARPs also get a fresh
+-- UUID, so bulk_upsert_arps returns the stored ids (the upsert conflicts on
+-- codigo_arp_api) and items are built from those; ingestor.py joins arps on
+-- codigo_arp_api instead.
+--
+-- Existing duplicates are removed first, keeping the most recently synced
+-- row of each (arp_id, numero_item). Rows with NULL numero_item never
+-- conflict and are left alone. The cleanup only runs while the index is
+-- missing, so re-running skips the full-table sort.
+--
+-- If a CONCURRENTLY build fails (e.g. a running ETL inserted a duplicate
+-- between the cleanup and the build), it leaves an INVALID index that
+-- IF NOT EXISTS would skip forever while ON CONFLICT (arp_id, numero_item)
+-- fails. Such an index is dropped first, so re-running cleans up and rebuilds.
+--
+-- Run with psql (autocommit): CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- DROP INVALID INDEX
+-- ============================================================================
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM pg_index
+        WHERE indexrelid = to_regclass('idx_itens_arp_numero_item')
+          AND NOT indisvalid
+    ) THEN
+        DROP INDEX idx_itens_arp_numero_item;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- CLEANUP: duplicated items (only while the index is missing)
+-- ============================================================================
+DO $$
+BEGIN
+    IF to_regclass('idx_itens_arp_numero_item') IS NULL THEN
+        DELETE FROM itens_arp
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT
+                    id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY arp_id, numero_item
+                        ORDER BY last_synced_at DESC NULLS LAST, updated_at DESC NULLS LAST, id
+                    ) AS rn
+                FROM itens_arp
+                WHERE numero_item IS NOT NULL
+            ) ranked
+            WHERE rn > 1
+        );
+    END IF;
+END $$;
+
+-- ============================================================================
+-- INDEX: itens_arp natural key
+-- ============================================================================
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_itens_arp_numero_item
+    ON itens_arp(arp_id, numero_item);
+
+VACUUM ANALYZE itens_arp;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Should return no rows
+-- SELECT arp_id, numero_item, COUNT(*)
+-- FROM itens_arp
+-- WHERE numero_item IS NOT NULL
+-- GROUP BY arp_id, numero_item
+-- HAVING COUNT(*) > 1;
+--
+-- indisvalid should be true (a failed CONCURRENTLY build leaves it false)
+-- SELECT indisvalid FROM pg_index WHERE indexrelid = 'idx_itens_arp_numero_item'::regclass;
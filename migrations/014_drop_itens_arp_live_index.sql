@@ -0,0 +1,39 @@
+-- AtaHub Carona - Drop duplicate live-items index
+-- Migration: 014_drop_itens_arp_live_index.sql
+-- Purpose: Remove idx_itens_arp_live, already covered by idx_itens_arp_numero_item
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- CONTEXT
+-- ============================================================================
+-- /arp/{id} (ARP_DETAIL_SQL in backend/queries.py) reads
+--     WHERE itens_arp.arp_id = :arp_id AND itens_arp.item_excluido = FALSE
+--     ORDER BY itens_arp.numero_item
+-- The unique idx_itens_arp_numero_item (013) on (arp_id, numero_item) already
+-- returns the ARP's items in numero_item order; excluded items are rare, so
+-- filtering them out of that range is cheap. A partial idx_itens_arp_live on
+-- the same columns only added write cost to every item upsert.
+--
+-- Databases that built idx_itens_arp_live from an earlier version of this
+-- migration have it dropped here; elsewhere this is a no-op.
+--
+-- The foreign keys themselves are already indexed since 001
+-- (idx_itens_arp_id, idx_etl_errors_execution); cascading deletes from arps
+-- and etl_executions use them.
+--
+-- Run with psql (autocommit): DROP INDEX CONCURRENTLY cannot run inside a
+-- transaction block.
+
+-- ============================================================================
+-- DROP INDEX: live items per ARP
+-- ============================================================================
+DROP INDEX CONCURRENTLY IF EXISTS idx_itens_arp_live;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+-- Plan should show "Index Scan using idx_itens_arp_numero_item" and no Sort node
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT * FROM itens_arp
+-- WHERE arp_id = (SELECT id FROM arps LIMIT 1) AND item_excluido = FALSE
+-- ORDER BY numero_item;
@@ -0,0 +1,32 @@
+#!/bin/sh
+# Apply every pending numbered migration in order against $DATABASE_URL.
+# Applied files are recorded in schema_migrations and skipped on later
+# deploys, so one-off statements (dedupes, VACUUM/ANALYZE, MV refreshes)
+# run once. Migrations stay idempotent, so a file that fails midway is
+# simply re-run on the next deploy.
+set -e
+
+MIGRATIONS_DIR="$(dirname "$0")"
+
+psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -q -c "
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        filename TEXT PRIMARY KEY,
+        applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )"
+
+for f in "$MIGRATIONS_DIR"/[0-9][0-9][0-9]_*.sql; do
+    name="$(basename "$f")"
+    applied="$(psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -tA \
+        -c "SELECT 1 FROM schema_migrations WHERE filename = '$name'")"
+    if [ -n "$applied" ]; then
+        echo "Skipping $name (already applied)"
+        continue
+    fi
+
+    echo "Applying $name"
+    psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -q -f "$f"
+    psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -q \
+        -c "INSERT INTO schema_migrations (filename) VALUES ('$name')"
+done
+
+echo "Migrations applied."